@@ -47,7 +47,7 @@ from app.database.get_session import get_async_session
 from app.core.config import settings
 from app.core.loggers import app_logger as logger
 from app.utils.telegram import send_telegram_msg
-from app.services.redis_push import redis_lpush
+from app.services.redis_push import redis_push_async
 from app.cruds.activity_logs import activity_log_crud
 from app.schemas.activity_logs import ActivityLogCreateSchema
 from app.services.session_service import create_user_session
@@ -195,7 +195,7 @@ class AuthRouter:
                 user_uuid=user.uuid,
             )
 
-            redis_lpush(
+            await redis_push_async(
                 {
                     "queue_name": "notifications",
                     "operation": "send_email",
@@ -219,16 +219,17 @@ class AuthRouter:
         db_user: User = await self.crud.get(
             db=session, uuid=user.uuid, include_relations="roles"
         )
-        await activity_log_crud.create(
-            db=session,
-            obj_in=ActivityLogCreateSchema(
-                user_uuid=None,
-                entity=self.singular,
-                action="create",
-                previous_data={},
-                new_data=db_user.to_dict(),
-                description="User created successfully.",
-            ),
+        await activity_log_crud.enqueue(
+            [
+                ActivityLogCreateSchema(
+                    user_uuid=None,
+                    entity=self.singular,
+                    action="create",
+                    previous_data={},
+                    new_data=db_user.to_dict(),
+                    description="User created successfully.",
+                )
+            ]
         )
 
         return created_response(
@@ -271,7 +272,7 @@ class AuthRouter:
                 user_uuid=db_user.uuid,
             )
 
-            redis_lpush(
+            await redis_push_async(
                 {
                     "queue_name": "notifications",
                     "operation": "send_email",
@@ -326,7 +327,7 @@ class AuthRouter:
             user_uuid=db_user.uuid,
         )
 
-        redis_lpush(
+        await redis_push_async(
             {
                 "queue_name": "notifications",
                 "operation": "send_email",
@@ -426,16 +427,17 @@ class AuthRouter:
         except Exception as e:
             logger.error(f"Error creating session: {e}")
 
-        await activity_log_crud.create(
-            db=db,
-            obj_in=ActivityLogCreateSchema(
-                user_uuid=db_user.uuid,
-                entity=self.singular,
-                action="login",
-                previous_data=db_user.to_dict(),
-                new_data={},
-                description="User logged in successfully.",
-            ),
+        await activity_log_crud.enqueue(
+            [
+                ActivityLogCreateSchema(
+                    user_uuid=db_user.uuid,
+                    entity=self.singular,
+                    action="login",
+                    previous_data=db_user.to_dict(),
+                    new_data={},
+                    description="User logged in successfully.",
+                )
+            ]
         )
         return {
             "status": status.HTTP_200_OK,
@@ -540,7 +542,7 @@ class AuthRouter:
         url = f"{settings.FRONTEND_URL}/reset-password?code={urllib.parse.quote(verification_code.code)}&email={urllib.parse.quote(db_user.email)}"
         try:
 
-            redis_lpush(
+            await redis_push_async(
                 {
                     "queue_name": "notifications",
                     "operation": "send_email",
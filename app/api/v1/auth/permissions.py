@@ -1,10 +1,14 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.utils.responses import (
     success_response,
     not_found_response,
     bad_request_response,
+    json_response,
 )
 from app.deps.user import get_user_with_permission
 from app.schemas.permissions import (
@@ -13,13 +17,20 @@ from app.schemas.permissions import (
     PermissionResponseSchema,
     PermissionTotalCountListResponseSchema,
     PermissionFiltersSchema,
+    PermissionCheckSchema,
+    PermissionCheckResponseSchema,
 )
 from app.schemas.validate_uuid import UUIDStr
 from app.models.users import User
+from app.models.permissions import Permission
+from app.models.role_permissions import RolePermission
+from app.models.user_roles import UserRole
 from app.cruds.permissions import permission_crud
 from app.database.get_session import get_async_session
 from app.core.loggers import app_logger as logger
 
+PERMISSION_LIST_RESPONSE_ADAPTER = TypeAdapter(PermissionTotalCountListResponseSchema)
+
 
 def get_internal_label(label: Optional[str] = Query(None, include_in_schema=False)):  # type: ignore
     return label
@@ -30,6 +41,13 @@ class PermissionRouter:
         self.router = APIRouter()
         self.singular = "Permission"
         self.plural = "Permissions"
+        self._msg_not_found = f"{self.singular} not found"
+        self._msg_exists = f"{self.singular} already exists"
+        self._msg_created = f"{self.singular} created successfully"
+        self._msg_fetched = f"{self.singular} fetched successfully"
+        self._msg_listed = f"{self.plural} fetched successfully"
+        self._msg_updated = f"{self.singular} updated successfully"
+        self._msg_deleted = f"{self.singular} deleted successfully"
         self.crud = permission_crud
         self.response_model = PermissionResponseSchema
         self.response_list_model = PermissionTotalCountListResponseSchema
@@ -45,8 +63,8 @@ class PermissionRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
-            response_model_exclude_unset=True,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
         )
         self.router.add_api_route(
             "/groups/permissions",
@@ -56,6 +74,14 @@ class PermissionRouter:
             summary=f"Get all {self.plural} grouped by action",
             response_model=dict,
         )
+        self.router.add_api_route(
+            "/check",
+            self.check,
+            methods=["POST"],
+            status_code=status.HTTP_200_OK,
+            summary=f"Check several {self.plural} for a user at once",
+            response_model=PermissionCheckResponseSchema,
+        )
         self.router.add_api_route(
             "/{uuid}",
             self.get,
@@ -86,21 +112,18 @@ class PermissionRouter:
     ):
         logger.info(f"Creating {self.singular}: {data.__dict__}")
         data.name = data.name.lower()
-        # Check if permission already exists
-        permission = await self.crud.get(db=db, name=data.name)
-        if permission:
-            logger.warning(f"{self.singular} {data.name} already exists")
-            return bad_request_response(f"{self.singular} already exists")
         try:
+            # The unique name column rejects duplicates
             permission = await self.crud.create(db=db, obj_in=data, user_uuid=user.uuid)
+        except IntegrityError:
+            logger.warning(f"{self.singular} {data.name} already exists")
+            return bad_request_response(self._msg_exists)
         except Exception as e:
             logger.error(f"Error creating {self.singular}: {str(e)}")
             return bad_request_response(str(e))
 
         logger.info(f"{self.singular} {data.name} created successfully")
-        return success_response(
-            message=f"{self.singular} created successfully", data=permission
-        )
+        return success_response(message=self._msg_created, data=permission)
 
     async def list(
         self,
@@ -114,12 +137,16 @@ class PermissionRouter:
             **filters.model_dump(),
         )
         logger.info(f"Fetched {len(permissions['data'])} {self.plural}")
-        return {
-            "status": status.HTTP_200_OK,
-            "detail": f"{self.plural} fetched successfully",
-            "data": permissions["data"],
-            "total_count": permissions["total_count"],
-        }
+        return json_response(
+            PERMISSION_LIST_RESPONSE_ADAPTER,
+            {
+                "status": status.HTTP_200_OK,
+                "detail": self._msg_listed,
+                "data": permissions["data"],
+                "total_count": permissions["total_count"],
+            },
+            exclude_unset=True,
+        )
 
     async def list_grouped_permissions(
         self,
@@ -135,6 +162,34 @@ class PermissionRouter:
             "data": permissions,
         }
 
+    async def check(
+        self,
+        data: PermissionCheckSchema,
+        user: User = Depends(get_user_with_permission("can_read_permissions")),
+        db: AsyncSession = Depends(get_async_session),
+    ):
+        """
+        Resolve many permission names for one user in a single lookup.
+        """
+        names = {name.lower() for name in data.permission_names}
+        if data.user_uuid == user.uuid:
+            # The authenticated user's permissions are already cached
+            granted = {permission.name.lower() for permission in user.permissions or []}
+        else:
+            result = await db.execute(
+                select(Permission.name)
+                .join(RolePermission, RolePermission.permission_uuid == Permission.uuid)
+                .join(UserRole, UserRole.role_uuid == RolePermission.role_uuid)
+                .where(UserRole.user_uuid == data.user_uuid, Permission.name.in_(names))
+                .distinct()
+            )
+            granted = set(result.scalars().all())
+        logger.info(f"Checked {len(names)} {self.plural} for user {data.user_uuid}")
+        return success_response(
+            message=f"{self.plural} checked successfully",
+            data={name: name.lower() in granted for name in data.permission_names},
+        )
+
     async def get(
         self,
         uuid: UUIDStr,
@@ -149,11 +204,9 @@ class PermissionRouter:
         )
         if not permission:
             logger.warning(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
         logger.info(f"{self.singular} with uuid {uuid} fetched successfully")
-        return success_response(
-            message=f"{self.singular} fetched successfully", data=permission
-        )
+        return success_response(message=self._msg_fetched, data=permission)
 
     async def update(
         self,
@@ -165,7 +218,7 @@ class PermissionRouter:
         permission = await self.crud.get(db=db, uuid=uuid)
         if not permission:
             logger.warning(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
 
         try:
             previous_permission = permission.to_dict()
@@ -175,12 +228,14 @@ class PermissionRouter:
             logger.info(
                 f"User {user.uuid} updated role from {previous_permission} to {new_permission.to_dict()}"
             )
+        except IntegrityError:
+            # The case-insensitive unique name index rejects duplicate names
+            logger.error(f"{self.singular} already exists")
+            return bad_request_response(self._msg_exists)
         except Exception as e:
             logger.error(f"Error updating {self.singular}: {str(e)}")
             return bad_request_response(str(e))
-        return success_response(
-            message=f"{self.singular} updated successfully", data=permission
-        )
+        return success_response(message=self._msg_updated, data=permission)
 
     async def delete(
         self,
@@ -191,7 +246,7 @@ class PermissionRouter:
         permission = await self.crud.get(db, uuid=uuid)
         if not permission:
             logger.warning(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
 
         logger.critical(
             f"{self.singular} to be deleted: {permission.to_dict()} by user {user.uuid}"
@@ -201,6 +256,4 @@ class PermissionRouter:
         logger.critical(
             f"{self.singular} {uuid} deleted successfully by user {user.uuid}"
         )
-        return success_response(
-            message=f"{self.singular} deleted successfully", data=permission
-        )
+        return success_response(message=self._msg_deleted, data=permission)
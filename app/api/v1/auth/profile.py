@@ -1,13 +1,20 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, File, UploadFile, status, Header
+from io import BytesIO
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    UploadFile,
+    status,
+    Header,
+)
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 from app.deps.user import get_current_user, reuseable_oauth
 from app.models.users import User
-from app.models.roles import Role
-from app.models.role_permissions import RolePermission
 from app.core.config import settings
 from app.utils.password_util import verify_password, hash_password
 from app.utils.responses import bad_request_response, success_response
@@ -23,6 +30,7 @@ from app.cruds.users import user_crud
 from app.cruds.activity_logs import activity_log_crud
 from app.schemas.users import (
     UserResponseSchema,
+    UserSchema,
     UserUpdateNewPasswordSchema,
     UserUpdateWithPasswordSchema,
     UserUpdateProfileSchema,
@@ -30,8 +38,8 @@ from app.schemas.users import (
 )
 from app.schemas.activity_logs import ActivityLogCreateSchema
 from app.utils.object_storage import save_file_to_s3
-from app.database.get_session import get_async_session
-from app.core.constants import ALLOWED_IMAGE_EXTENSIONS
+from app.database.get_session import AsyncSessionLocal, get_async_session
+from app.core.constants import ALLOWED_IMAGE_EXTENSIONS, IMAGE_SIGNATURES
 from app.core.loggers import app_logger as logger
 from app.services.redis_base import get_async_redis_client
 
@@ -74,7 +82,7 @@ class UserProfileRouter:
             "/change-avatar/",
             self.change_avatar,
             methods=["PUT"],
-            status_code=status.HTTP_200_OK,
+            status_code=status.HTTP_202_ACCEPTED,
             summary=f"Update a current user's avatar",
             response_model=dict,
             response_model_exclude_unset=True,
@@ -106,16 +114,22 @@ class UserProfileRouter:
         logger.info(f"Fetching user details for the current user {user.email}")
         stmt = (
             select(User)
-            .options(
-                joinedload(User.roles)
-                .joinedload(Role.role_permissions)
-                .joinedload(RolePermission.permission),
-                joinedload(User.country),
-            )
+            .options(selectinload(User.roles), joinedload(User.country))
             .where(User.uuid == user.uuid)
         )
 
-        data = await self.crud.get(db, statement=stmt)
+        db_user = await self.crud.get(db, statement=stmt)
+        # Permissions come from the Redis-cached auth user instead of joining
+        # roles -> role_permissions -> permissions again
+        data = UserSchema.model_validate(
+            {
+                **db_user.to_schema_dict(),
+                "country": db_user.country.to_dict() if db_user.country else None,
+                "user_permissions": [
+                    permission.name for permission in user.permissions or []
+                ],
+            }
+        )
         logger.info(f"User details fetched successfully for {user.email}")
         return success_response("User details fetched successfully.", data=data)
 
@@ -129,9 +143,7 @@ class UserProfileRouter:
         Update user's password.
         """
         logger.info(f"Updating password for user {user.email}")
-        db_user: User = await self.crud.get(
-            db=session, uuid=user.uuid, include_relations="roles"
-        )
+        db_user: User = await self.crud.get(db=session, uuid=user.uuid)
 
         if not verify_password(data.old_password, db_user.password):
             logger.warning(f"Old password is incorrect for user {db_user.email}")
@@ -161,9 +173,7 @@ class UserProfileRouter:
         """
         Update user's profile.
         """
-        db_user: User = await self.crud.get(
-            session, uuid=user.uuid, include_relations="roles"
-        )
+        db_user: User = await self.crud.get(session, uuid=user.uuid)
 
         if not db_user:
             logger.error(f"User {user.email} not found")
@@ -185,50 +195,72 @@ class UserProfileRouter:
 
     async def change_avatar(
         self,
+        background_tasks: BackgroundTasks,
         avatar: UploadFile = File(
             ...,
-            description=f"User avatar file, we accept image files only. We accept {', '.join(ALLOWED_IMAGE_EXTENSIONS)}",
+            description=f"User avatar file, we accept image files only. We accept {', '.join(sorted(ALLOWED_IMAGE_EXTENSIONS))}",
         ),
-        session: AsyncSession = Depends(get_async_session),
         user: User = Depends(get_current_user),
     ):
         """
-        Update user's profile.
+        Update user's avatar.
+
+        The upload to object storage runs after the response is sent; the
+        new avatar shows up on the profile once it has been stored.
         """
         logger.info(f"Updating avatar for user {user.email}")
-        avatar_extension = avatar.filename.split(".")[-1]
+        avatar_extension = avatar.filename.rsplit(".", 1)[-1].lower()
         if avatar_extension not in ALLOWED_IMAGE_EXTENSIONS:
             logger.warning(
                 f"File extension {avatar_extension} is not allowed for user {user.email}"
             )
             return bad_request_response(
-                f"File extension {avatar_extension} is not allowed. We only accept {', '.join(ALLOWED_IMAGE_EXTENSIONS)}"
+                f"File extension {avatar_extension} is not allowed. We only accept {', '.join(sorted(ALLOWED_IMAGE_EXTENSIONS))}"
             )
 
-        avatar_url = await save_file_to_s3(
-            file_object=avatar,
-            extension=f".{str(avatar_extension)}",
-            folder="users/avatars",
-            access_type="private",
-        )
-        logger.info(
-            f"Avatar URL {avatar_url} generated successfully for user {user.email}"
-        )
-        db_user: User = await self.crud.get(
-            session, uuid=user.uuid, include_relations="roles"
-        )
-
-        await self.crud.update(
-            db=session,
-            db_obj=db_user,
-            obj_in=UserUpdateSchema(avatar=avatar_url),
-            user_uuid=user.uuid,
+        # The upload file is closed once the response is sent, so hand the
+        # background task the bytes rather than the file object
+        content = await avatar.read()
+        # Don't trust the file name alone; the content must look like an image
+        if not any(content.startswith(magic) for magic in IMAGE_SIGNATURES):
+            logger.warning(f"Avatar upload for user {user.email} is not an image")
+            return bad_request_response(
+                f"File content is not a valid image. We only accept {', '.join(sorted(ALLOWED_IMAGE_EXTENSIONS))}"
+            )
+        background_tasks.add_task(
+            self._upload_avatar, content, avatar_extension, user.uuid, user.email
         )
-        logger.info(f"Avatar updated successfully for user {user.email}")
         return success_response(
-            "Avatar updated successfully.", data={"avatar": avatar_url}
+            "Avatar upload queued.", status_code=status.HTTP_202_ACCEPTED
         )
 
+    async def _upload_avatar(
+        self, content: bytes, extension: str, user_uuid: str, email: str
+    ):
+        """Store the avatar in object storage and point the user at it."""
+        try:
+            avatar_url = await save_file_to_s3(
+                file_object=BytesIO(content),
+                extension=f".{extension}",
+                folder="users/avatars",
+                access_type="private",
+            )
+            logger.info(
+                f"Avatar URL {avatar_url} generated successfully for user {email}"
+            )
+            # The request session is closed by the time this runs
+            async with AsyncSessionLocal() as session:
+                db_user: User = await self.crud.get(session, uuid=user_uuid)
+                await self.crud.update(
+                    db=session,
+                    db_obj=db_user,
+                    obj_in=UserUpdateSchema(avatar=avatar_url),
+                    user_uuid=user_uuid,
+                )
+            logger.info(f"Avatar updated successfully for user {email}")
+        except Exception as e:
+            logger.error(f"Error updating avatar for user {email}: {e}")
+
     async def generate_refresh_token(self, refresh_token: str = Header(...)):
         """Generate access token from refresh token."""
         logger.info("Generating access token from refresh token")
@@ -286,7 +318,7 @@ class UserProfileRouter:
 
                 user_session = await get_session_by_jti(session, token_jti)
                 if user_session:
-                    await close_user_session(session, str(user_session.uuid))
+                    await close_user_session(session, user_session)
 
             await invalidate_user_tokens_async(str(user.uuid))
             # Cleanup cache using hashed token key
@@ -295,20 +327,19 @@ class UserProfileRouter:
             await async_redis.delete(f"token:{token_hash}")
 
             # Get user data for activity log (if needed)
-            db_user = await self.crud.get(
-                db=session, uuid=user.uuid, include_relations="roles"
-            )
+            db_user = await self.crud.get(db=session, uuid=user.uuid)
 
-            await activity_log_crud.create(
-                db=session,
-                obj_in=ActivityLogCreateSchema(
-                    user_uuid=user.uuid,
-                    entity=self.singular,
-                    action="logout",
-                    previous_data=db_user.to_dict() if db_user else {},
-                    new_data={},
-                    description="Logged out successfully. All tokens invalidated.",
-                ),
+            await activity_log_crud.enqueue(
+                [
+                    ActivityLogCreateSchema(
+                        user_uuid=user.uuid,
+                        entity=self.singular,
+                        action="logout",
+                        previous_data=db_user.to_dict() if db_user else {},
+                        new_data={},
+                        description="Logged out successfully. All tokens invalidated.",
+                    )
+                ]
             )
 
             logger.info(f"User {user.email} logged out successfully")
@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from app.models.permissions import Permission
 from app.utils.responses import (
     success_response,
     not_found_response,
     bad_request_response,
+    json_response,
 )
 from app.deps.user import get_user_with_permission
 from app.schemas.role_permissions import (
@@ -13,14 +18,21 @@ from app.schemas.role_permissions import (
     RolePermissionResponseSchema,
     RolePermissionTotalCountListResponseSchema,
     RolePermissionFilters,
+    RolePermissionSchema,
 )
 from app.models.users import User
 from app.models.role_permissions import RolePermission
 from app.cruds.role_permissions import role_permission_crud
-from app.database.get_session import get_async_session
+from app.database.get_session import AsyncSessionLocal, get_async_session
 from app.core.loggers import app_logger as logger
 from app.cruds.permissions import permission_crud
 from app.schemas.validate_uuid import UUIDStr
+from app.utils.security_util import invalidate_all_permissions_async
+
+ROLE_PERMISSION_ADAPTER = TypeAdapter(RolePermissionSchema)
+ROLE_PERMISSION_LIST_RESPONSE_ADAPTER = TypeAdapter(
+    RolePermissionTotalCountListResponseSchema
+)
 
 
 class RolePermissionRouter:
@@ -28,6 +40,11 @@ class RolePermissionRouter:
         self.router = APIRouter()
         self.singular = "Role Permission"
         self.plural = "Role Permissions"
+        self._msg_not_found = f"{self.singular} not found"
+        self._msg_already_assigned = f"{self.singular} already assigned"
+        self._msg_listed = f"{self.plural} fetched successfully"
+        self._msg_removed = f"{self.singular} removed successfully"
+        self._msg_assigned = f"{self.singular} assigned successfully"
         self.crud = role_permission_crud
         self.response_model = RolePermissionResponseSchema
         self.response_list_model = RolePermissionTotalCountListResponseSchema
@@ -51,8 +68,8 @@ class RolePermissionRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
-            response_model_exclude_unset=True,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
         )
         self.router.add_api_route(
             "/{role_uuid}/permissions/{permission_uuid}",
@@ -69,24 +86,22 @@ class RolePermissionRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         logger.info(f"Creating {self.singular}: {data.__dict__} by user {user.uuid}")
-        existing = await self.crud.get(
-            db, role_uuid=data.role_uuid, permission_uuid=data.permission_uuid
-        )
-        if existing:
-            logger.error(f"{self.singular} already assigned")
-            return bad_request_response(f"{self.singular} already assigned")
-
         try:
+            # The unique (role_uuid, permission_uuid) index rejects duplicates
             role_permission = await self.crud.create(
                 db=db, obj_in=data, user_uuid=user.uuid
             )
             logger.info(f"{self.singular} assigned successfully")
+            await invalidate_all_permissions_async()
+        except IntegrityError:
+            logger.error(f"{self.singular} already assigned")
+            return bad_request_response(self._msg_already_assigned)
         except Exception as e:
             logger.error(f"Error assigning {self.singular}: {str(e)}")
             return bad_request_response(str(e))
 
         return success_response(
-            message=f"{self.singular} assigned successfully",
+            message=self._msg_assigned,
             data=role_permission.to_dict(),
         )
 
@@ -104,7 +119,8 @@ class RolePermissionRouter:
         """
         role_permissions = []
 
-        for permission_uuid in permission_data.permissions:
+        # A uuid listed twice would be inserted twice
+        for permission_uuid in dict.fromkeys(permission_data.permissions):
             perm: Permission = await permission_crud.get(db=db, uuid=permission_uuid)
             if not perm:
                 logger.error(f"Permission with uuid {permission_uuid} not found")
@@ -124,9 +140,19 @@ class RolePermissionRouter:
                 )
             )
 
-        role_permissions = await self.crud.create_multi(
-            db=db, objs_in=role_permissions, user_uuid=user.uuid
-        )
+        try:
+            # The unique (role_uuid, permission_uuid) index rejects duplicates
+            role_permissions = await self.crud.create_multi(
+                db=db, objs_in=role_permissions, user_uuid=user.uuid
+            )
+        except RuntimeError as e:
+            if isinstance(e.__cause__, IntegrityError):
+                logger.error(f"{self.singular} already assigned")
+                return bad_request_response(self._msg_already_assigned)
+            logger.error(f"Error assigning {self.plural}: {e}")
+            return bad_request_response(str(e))
+        if role_permissions:
+            await invalidate_all_permissions_async()
         logger.info(
             f"{self.plural} created successfully"
             if len(role_permissions)
@@ -152,19 +178,55 @@ class RolePermissionRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         logger.info(f"Fetching {self.plural} with filters: {filters.__dict__}")
+        if filters.format == "ndjson":
+            return StreamingResponse(
+                self._stream_ndjson(
+                    skip=filters.skip,
+                    limit=filters.limit,
+                    sort=filters.sort,
+                    role_uuid=filters.role_uuid,
+                    permission_uuid=filters.permission_uuid,
+                    search=filters.search,
+                    search_fields=filters.search_fields,
+                ),
+                media_type="application/x-ndjson",
+            )
+
         role_permissions = await self.crud.get_multi_with_cache(
             db=db,
             unique_records=True,
-            **filters.model_dump(),
+            **filters.model_dump(exclude={"format"}),
         )
         logger.info(f"{self.plural} fetched successfully")
 
-        return {
-            "status": status.HTTP_200_OK,
-            "detail": f"{self.plural} fetched successfully",
-            "total_count": role_permissions["total_count"],
-            "data": role_permissions["data"],
-        }
+        return json_response(
+            ROLE_PERMISSION_LIST_RESPONSE_ADAPTER,
+            {
+                "status": status.HTTP_200_OK,
+                "detail": self._msg_listed,
+                "total_count": role_permissions["total_count"],
+                "data": role_permissions["data"],
+            },
+            exclude_unset=True,
+        )
+
+    async def _stream_ndjson(self, **kwargs):
+        """Yield role permissions one JSON document per line."""
+        # The request session is closed once the handler returns, so the
+        # stream holds its own session for as long as the client is reading
+        async with AsyncSessionLocal() as db:
+            async for role_permission in self.crud.stream_multi(
+                db,
+                eager_load=[
+                    joinedload(RolePermission.role),
+                    joinedload(RolePermission.permission),
+                ],
+                **kwargs,
+            ):
+                item = ROLE_PERMISSION_ADAPTER.validate_python(
+                    role_permission, from_attributes=True
+                )
+                yield ROLE_PERMISSION_ADAPTER.dump_json(item) + b"\n"
 
     async def remove(
         self,
@@ -180,13 +242,14 @@ class RolePermissionRouter:
             logger.error(
                 f"{self.singular} with role uuid {role_uuid} and permission uuid {permission_uuid} not found"
             )
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
 
         logger.critical(
             f"{self.singular} to be removed: {role_permission.to_dict()} by user {user.uuid}"
         )
         await self.crud.remove(db, db_obj=role_permission, user_uuid=user.uuid)
+        await invalidate_all_permissions_async()
         logger.critical(
             f"{self.singular} with role uuid {role_uuid} and permission uuid {permission_uuid} removed successfully by user {user.uuid}"
         )
-        return success_response(message=f"{self.singular} removed successfully")
+        return success_response(message=self._msg_removed)
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from app.models.permissions import Permission
@@ -10,6 +12,7 @@ from app.utils.responses import (
     success_response,
     not_found_response,
     bad_request_response,
+    json_response,
 )
 from app.deps.user import get_user_with_permission
 from app.schemas.roles import (
@@ -32,6 +35,10 @@ from app.cruds.activity_logs import activity_log_crud
 from app.schemas.activity_logs import ActivityLogCreateSchema
 from app.core.defaults import default_roles
 from app.schemas.validate_uuid import UUIDStr
+from app.utils.security_util import invalidate_all_permissions_async
+
+ROLE_LIST_RESPONSE_ADAPTER = TypeAdapter(RoleTotalCountListResponseSchema)
+DEFAULT_ROLE_NAMES = frozenset(item["name"] for item in default_roles)
 
 
 class RoleRouter:
@@ -39,6 +46,14 @@ class RoleRouter:
         self.router = APIRouter()
         self.singular = "Role"
         self.plural = "Roles"
+        self._msg_not_found = f"{self.singular} not found"
+        self._msg_exists = f"{self.singular} already exists"
+        self._msg_created = f"{self.singular} created successfully"
+        self._msg_fetched = f"{self.singular} fetched successfully"
+        self._msg_listed = f"{self.plural} fetched successfully"
+        self._msg_updated = f"{self.singular} updated successfully"
+        self._msg_deleted = f"{self.singular} deleted successfully"
+        self._msg_permission_assigned = "Permission already assigned to the role"
         self.crud = role_crud
         self.response_model = RoleResponseSchema
         self.response_list_model = RoleTotalCountListResponseSchema
@@ -73,8 +88,8 @@ class RoleRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
-            response_model_exclude_unset=True,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
         )
         self.router.add_api_route(
             "/{uuid}",
@@ -106,20 +121,17 @@ class RoleRouter:
     ):
         logger.info(f"Creating {self.singular}: {data.model_dump()}")
         data.name = data.name.lower()
-        # check if role already exists
-        db_role = await self.crud.get(db=db, name=data.name)
-        if db_role:
-            logger.error(f"{self.singular} already exists")
-            return bad_request_response(f"{self.singular} already exists")
         try:
+            # The unique name column rejects duplicates
             role = await self.crud.create(db=db, obj_in=data, user_uuid=user.uuid)
+        except IntegrityError:
+            logger.error(f"{self.singular} already exists")
+            return bad_request_response(self._msg_exists)
         except Exception as e:
             logger.error(f"Error creating {self.singular}: {str(e)}")
             return bad_request_response(str(e))
         logger.info(f" {role.name} {self.singular} created successfully")
-        return success_response(
-            message=f"{self.singular} created successfully", data=role.to_dict()
-        )
+        return success_response(message=self._msg_created, data=role.to_dict())
 
     async def create_role_with_permissions(
         self,
@@ -135,13 +147,14 @@ class RoleRouter:
         db_role = await self.crud.get(db=db, name=data.name)
         if db_role:
             logger.error(f"{self.singular} already exists")
-            return bad_request_response(f"{self.singular} already exists")
+            return bad_request_response(self._msg_exists)
         try:
             permissions = data.permissions
             del data.permissions
             role = await self.crud.create(db=db, obj_in=data, user_uuid=user.uuid)
             role_permissions = []
-            for permission_uuid in permissions:
+            # A uuid listed twice would be inserted twice
+            for permission_uuid in dict.fromkeys(permissions):
 
                 perm: Permission = await permission_crud.get(
                     db=db, uuid=permission_uuid
@@ -164,6 +177,12 @@ class RoleRouter:
             logger.info(
                 f"{self.singular} created successfully with {len(role_permissions)} permissions"
             )
+        except RuntimeError as e:
+            if isinstance(e.__cause__, IntegrityError):
+                logger.error(f"{role_permission_crud.model_name} already assigned")
+                return bad_request_response(self._msg_permission_assigned)
+            logger.error(f"Error creating {self.singular}: {str(e)}")
+            return bad_request_response(str(e))
         except Exception as e:
             logger.error(f"Error creating {self.singular}: {str(e)}")
             return bad_request_response(str(e))
@@ -176,16 +195,17 @@ class RoleRouter:
             db=db,
             statement=stmt,
         )
-        await activity_log_crud.create(
-            db=db,
-            obj_in=ActivityLogCreateSchema(
-                user_uuid=user.uuid,
-                entity=self.singular,
-                action="create",
-                previous_data={},
-                new_data=role.to_dict(),
-                description=f"{self.singular} created successfully with permissions",
-            ),
+        await activity_log_crud.enqueue(
+            [
+                ActivityLogCreateSchema(
+                    user_uuid=user.uuid,
+                    entity=self.singular,
+                    action="create",
+                    previous_data={},
+                    new_data=role.to_dict(),
+                    description=f"{self.singular} created successfully with permissions",
+                )
+            ]
         )
         return success_response(
             message=f"{self.singular} created successfully with permissions", data=role
@@ -210,12 +230,16 @@ class RoleRouter:
             **filters.model_dump(),
         )
         logger.info(f"Fetched {len(roles['data'])} {self.plural}")
-        return {
-            "status": status.HTTP_200_OK,
-            "detail": f"{self.plural} fetched successfully",
-            "data": roles["data"],
-            "total_count": roles["total_count"],
-        }
+        return json_response(
+            ROLE_LIST_RESPONSE_ADAPTER,
+            {
+                "status": status.HTTP_200_OK,
+                "detail": self._msg_listed,
+                "data": roles["data"],
+                "total_count": roles["total_count"],
+            },
+            exclude_unset=True,
+        )
 
     async def get(
         self,
@@ -235,12 +259,10 @@ class RoleRouter:
 
         if not role:
             logger.error(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
         logger.info(f"{self.singular} fetched successfully")
 
-        return success_response(
-            message=f"{self.singular} fetched successfully", data=role
-        )
+        return success_response(message=self._msg_fetched, data=role)
 
     async def update(
         self,
@@ -253,7 +275,7 @@ class RoleRouter:
         role = await self.crud.get(db, uuid=uuid)
         if not role:
             logger.error(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
 
         try:
             previous_role = role.to_dict()
@@ -263,7 +285,10 @@ class RoleRouter:
             logger.info(
                 f"User {user.uuid} updated {self.singular} from {previous_role} to {role.to_dict()}"
             )
-
+        except IntegrityError:
+            # The case-insensitive unique name index rejects duplicate names
+            logger.error(f"{self.singular} already exists")
+            return bad_request_response(self._msg_exists)
         except Exception as e:
             logger.error(f"Error updating {self.singular}: {str(e)}")
             return bad_request_response(str(e))
@@ -271,9 +296,7 @@ class RoleRouter:
         updated_role = await self.crud.get(
             db, uuid=uuid, include_relations="permissions"
         )
-        return success_response(
-            message=f"{self.singular} updated successfully", data=updated_role
-        )
+        return success_response(message=self._msg_updated, data=updated_role)
 
     async def update_role_with_permissions(
         self,
@@ -286,8 +309,13 @@ class RoleRouter:
         role = await self.crud.get(db, uuid=uuid)
         if not role:
             logger.error(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
-        premissions_uuids = data.permissions
+            return not_found_response(self._msg_not_found)
+        premissions_uuids = (
+            # A uuid listed twice would be inserted twice
+            list(dict.fromkeys(data.permissions))
+            if data.permissions is not None
+            else None
+        )
         try:
             previous_role = role.to_dict()
             del data.permissions
@@ -295,45 +323,74 @@ class RoleRouter:
             logger.info(
                 f"User {user.uuid} updated {self.singular} from {previous_role} to {role.to_dict()}"
             )
-            if premissions_uuids is not None:
-                # Remove existing role permissions
-                await role_permission_crud.remove_multi(db, role_uuid=role.uuid)
-                logger.info(
-                    f"Existing permissions removed for {self.singular} with uuid {uuid}"
-                )
-                role_permissions = []
-                for permission_uuid in premissions_uuids:
-                    perm: Permission = await permission_crud.get(
-                        db=db, uuid=permission_uuid
+        except IntegrityError:
+            logger.error(f"{self.singular} already exists")
+            return bad_request_response(self._msg_exists)
+        except Exception as e:
+            logger.error(f"Error updating {self.singular}: {str(e)}")
+            return bad_request_response(str(e))
+
+        if premissions_uuids is not None:
+            # Resolve every requested permission in one query
+            result = await db.execute(
+                select(Permission.uuid).where(Permission.uuid.in_(premissions_uuids))
+            )
+            existing_uuids = set(result.scalars().all())
+            role_permissions = []
+            for permission_uuid in premissions_uuids:
+                if permission_uuid not in existing_uuids:
+                    logger.error(
+                        f"Permission with uuid {permission_uuid} not found, skipping assignment"
                     )
-                    if not perm:
-                        logger.error(
-                            f"Permission with uuid {permission_uuid} not found, skipping assignment"
-                        )
-                        continue
+                    continue
 
-                    role_permissions.append(
-                        RolePermissionCreateSchema(
-                            role_uuid=role.uuid, permission_uuid=permission_uuid
-                        )
+                role_permissions.append(
+                    RolePermissionCreateSchema(
+                        role_uuid=role.uuid, permission_uuid=permission_uuid
                     )
+                )
 
-                await role_permission_crud.create_multi(
-                    db=db, objs_in=role_permissions, user_uuid=user.uuid
+            # The role attributes are already committed; the removal and the new
+            # assignments are committed together, or rolled back together.
+            try:
+                await db.execute(
+                    delete(RolePermission).where(RolePermission.role_uuid == role.uuid)
                 )
                 logger.info(
-                    f"{self.singular} updated successfully with {len(role_permissions)} permissions"
+                    f"Existing permissions removed for {self.singular} with uuid {uuid}"
                 )
-        except Exception as e:
-            logger.error(f"Error updating {self.singular}: {str(e)}")
-            return bad_request_response(str(e))
+                if role_permissions:
+                    # Reloads the new rows before logging them
+                    await role_permission_crud.create_multi(
+                        db=db, objs_in=role_permissions, user_uuid=user.uuid
+                    )
+                else:
+                    await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(
+                    f"Error updating permissions for {self.singular} {uuid}: {str(e)}"
+                )
+                # create_multi wraps the unique index violation in a RuntimeError
+                reason = (
+                    self._msg_permission_assigned
+                    if isinstance(e.__cause__, IntegrityError)
+                    else str(e)
+                )
+                return bad_request_response(
+                    f"{self.singular} updated but permissions could not be updated: {reason}"
+                )
+            # The removed assignments may still have cached item entries
+            await role_permission_crud.invalidate_cache()
+            await invalidate_all_permissions_async()
+            logger.info(
+                f"{self.singular} updated successfully with {len(role_permissions)} permissions"
+            )
         logger.info(f"{self.singular} updated successfully")
         updated_role = await self.crud.get(
             db, uuid=uuid, include_relations="permissions"
         )
-        return success_response(
-            message=f"{self.singular} updated successfully", data=updated_role
-        )
+        return success_response(message=self._msg_updated, data=updated_role)
 
     async def delete(
         self,
@@ -345,7 +402,7 @@ class RoleRouter:
         role: Role = await self.crud.get(db, uuid=uuid)
         if not role:
             logger.error(f"{self.singular} with uuid {uuid} not found")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
         logger.critical(
             f"{self.singular} to be deleted: {role.to_dict()} by user {user.uuid}"
         )
@@ -357,7 +414,7 @@ class RoleRouter:
                 f"This {self.singular} cannot be deleted! Remove the delete protection first."
             )
 
-        if role.name in [item["name"] for item in default_roles]:
+        if role.name in DEFAULT_ROLE_NAMES:
             logger.critical(
                 f"{self.singular} with uuid {uuid} is a default role and cannot be deleted"
             )
@@ -365,7 +422,9 @@ class RoleRouter:
         await role_permission_crud.remove_multi(db, role_uuid=role.uuid)
         logger.critical("Role Permissions successfully removed for role")
         await self.crud.remove(db, db_obj=role, user_uuid=user.uuid)
+        # Users who held the role must not keep its permissions from the cache
+        await invalidate_all_permissions_async()
         logger.critical(
             f"{self.singular} {uuid} deleted successfully by user {user.uuid}"
         )
-        return success_response(message=f"{self.singular} deleted successfully")
+        return success_response(message=self._msg_deleted)
@@ -61,7 +61,7 @@ class UserSessionRouter:
         sessions = await self.crud.get_multi(
             db=db,
             user_uuid=user.uuid,
-            **filters.model_dump(),
+            **filters.to_kwargs(),
         )
 
         return {
@@ -106,7 +106,7 @@ class UserSessionRouter:
             return not_found_response(f"{self.singular} not found!")
 
         # Close the session
-        await close_user_session(db, uuid)
+        await close_user_session(db, session)
 
         logger.info(f"Session {uuid} revoked successfully")
         return success_response(f"{self.singular} revoked successfully!")
@@ -1,5 +1,6 @@
 from typing import List
 from fastapi import APIRouter, Depends
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.utils.responses import (
     success_response,
@@ -17,6 +18,7 @@ from app.database.get_session import get_async_session
 from app.core.loggers import app_logger as logger
 from app.schemas.validate_uuid import UUIDStr
 from app.schemas.user_deps import UserDepSchema
+from app.utils.security_util import invalidate_user_permissions_async
 
 
 class UserRoleRouter:
@@ -24,6 +26,10 @@ class UserRoleRouter:
         self.router = APIRouter()
         self.singular = "User Role"
         self.plural = "User Roles"
+        self._msg_not_found = f"{self.singular} not found"
+        self._msg_already_assigned = f"{self.singular} already assigned"
+        self._msg_removed = f"{self.singular} removed successfully"
+        self._msg_assigned = f"{self.singular} assigned successfully"
         self.crud = user_roles_crud
         self.response_model = UserRoleResponseSchema
         self.response_list_model = UserRoleTotalCountListResponseSchema
@@ -50,22 +56,23 @@ class UserRoleRouter:
         user: UserDepSchema = Depends(get_user_with_permission("can_write_user_roles")),
         db: AsyncSession = Depends(get_async_session),
     ):
-        for item in data:
-            logger.info(f"Creating {self.singular}: {item.model_dump()}")
-            existing = await self.crud.get(
-                db, role_uuid=item.role_uuid, user_uuid=item.user_uuid
-            )
-            if existing:
+        logger.info(f"Creating {self.plural}: {[item.model_dump() for item in data]}")
+        try:
+            # The unique (user_uuid, role_uuid) index rejects duplicates
+            await self.crud.create_multi(db=db, objs_in=data, user_uuid=user.uuid)
+        except RuntimeError as e:
+            if isinstance(e.__cause__, IntegrityError):
                 logger.error(f"{self.singular} already assigned")
-                return bad_request_response(f"{self.singular} already assigned")
-
-            try:
-                await self.crud.create(db=db, obj_in=item, user_uuid=user.uuid)
-            except Exception as e:
-                logger.error(f"Error creating {self.singular}: {e}")
-                return bad_request_response(str(e))
-            logger.info(f"{self.singular} assigned successfully")
-        return success_response(message=f"{self.singular} assigned successfully")
+                return bad_request_response(self._msg_already_assigned)
+            logger.error(f"Error creating {self.singular}: {e}")
+            return bad_request_response(str(e))
+        except Exception as e:
+            logger.error(f"Error creating {self.singular}: {e}")
+            return bad_request_response(str(e))
+        for user_uuid in {item.user_uuid for item in data}:
+            await invalidate_user_permissions_async(user_uuid)
+        logger.info(f"{len(data)} {self.plural} assigned successfully")
+        return success_response(message=self._msg_assigned)
 
     async def remove(
         self,
@@ -80,7 +87,7 @@ class UserRoleRouter:
 
         if not user_role:
             logger.critical(f"{self.singular} to be deleted with uuid: {uuid}")
-            return not_found_response(f"{self.singular} not found")
+            return not_found_response(self._msg_not_found)
         if user_role.user_uuid == user.uuid:
             logger.critical(
                 f"{self.singular} to be deleted: You cannot delete your own role. Role: {user_role.role_uuid} User: {user.uuid}"
@@ -91,7 +98,8 @@ class UserRoleRouter:
             f"{self.singular} to be deleted: {user_role.to_dict()} by user: {user.uuid}"
         )
         await self.crud.remove(db, db_obj=user_role, user_uuid=user.uuid)
+        await invalidate_user_permissions_async(user_role.user_uuid)
         logger.critical(
             f"{self.singular} with uuid {uuid} removed successfully by user: {user.uuid}"
         )
-        return success_response(message=f"{self.singular} removed successfully")
+        return success_response(message=self._msg_removed)
@@ -1,14 +1,23 @@
-from typing import List
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Tuple
 import urllib.parse
 from fastapi import APIRouter, Depends, status
-from sqlalchemy import and_, not_, or_, select
-from sqlalchemy.orm import joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import delete, lambda_stmt, not_, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.expression import Exists
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.orm import defer, joinedload, raiseload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.roles import Role
+from app.models.user_roles import UserRole
 from app.utils.responses import (
     success_response,
     not_found_response,
     bad_request_response,
+    json_response,
 )
 from app.deps.user import get_user_with_permission
 from app.schemas.users import (
@@ -16,6 +25,7 @@ from app.schemas.users import (
     UserResponseWithoutRoutesSchema,
     UserTotalCountListResponseSchema,
     UserFilters,
+    UserSnapshotSchema,
     AdminUpdateUserSchema,
     AdminSendEmailSchema,
 )
@@ -27,11 +37,69 @@ from app.cruds.user_roles import user_roles_crud
 from app.database.get_session import get_async_session
 from app.core.config import settings
 from app.core.loggers import app_logger as logger
-from app.services.redis_push import redis_lpush
+from app.services.redis_push import redis_push_async
+from app.utils.security_util import invalidate_user_permissions_async
 from app.cruds.activity_logs import activity_log_crud
 from app.schemas.activity_logs import ActivityLogCreateSchema
 from app.schemas.validate_uuid import UUIDStr
 
+INITIALIZE_ACCOUNT_EMAIL_BODY = """
+<p>Welcome! Click the link below to initialize your account and set your password:</p>
+<p><a href="{url}">Initialize Account</a></p>
+<p>If you didn’t request this, you can safely ignore this email.</p>
+"""
+INITIALIZE_ACCOUNT_URL = f"{settings.FRONTEND_URL}/auth/initialize-account?email="
+USER_LIST_RESPONSE_ADAPTER = TypeAdapter(UserTotalCountListResponseSchema)
+
+
+def user_snapshot(db_user: User) -> dict:
+    """JSON-safe copy of a user's columns for activity logs."""
+    return UserSnapshotSchema.model_validate(db_user).model_dump(mode="json")
+
+
+def select_user_with_roles(uuid: str) -> StatementLambdaElement:
+    """Select a user by uuid with roles and country loaded, reusing the cached compiled SQL."""
+    stmt = lambda_stmt(
+        lambda: select(User)
+        .options(selectinload(User.roles), joinedload(User.country))
+        .where(User.uuid == uuid)
+    )
+    if settings.DB_RAISELOAD:
+        # Fail loudly on anything the response touches that was not loaded
+        stmt += lambda s: s.options(raiseload("*"))
+    return stmt
+
+
+def user_has_role(*criteria) -> Exists:
+    """Correlated EXISTS over user_roles joined to roles, for filtering users by role."""
+    return (
+        select(UserRole.uuid)
+        .join(Role, Role.uuid == UserRole.role_uuid)
+        .where(UserRole.user_uuid == User.uuid, *criteria)
+        .exists()
+    )
+
+
+def encode_user_cursor(row: Any) -> str:
+    """Opaque keyset cursor pointing just past ``row`` in created_at/uuid order."""
+    # Cached pages hold plain dicts, fresh ones hold model instances
+    if isinstance(row, dict):
+        created_at, uuid = row["created_at"], row["uuid"]
+    else:
+        created_at, uuid = row.created_at, row.uuid
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return base64.urlsafe_b64encode(f"{created_at}|{uuid}".encode()).decode()
+
+
+def decode_user_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_user_cursor; raises ValueError on a malformed cursor."""
+    try:
+        created_at, uuid = base64.urlsafe_b64decode(cursor).decode().split("|")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return datetime.fromisoformat(created_at), uuid
+
 
 class UserRouter:
     def __init__(self):
@@ -58,8 +126,8 @@ class UserRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
-            response_model_exclude_unset=True,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
         )
         self.router.add_api_route(
             "/{uuid}",
@@ -105,21 +173,42 @@ class UserRouter:
         activity_logs = []
         for user_data in data:
             user_data.email = user_data.email.lower()
+
+        # Fetch existing users (active and soft deleted) and all requested roles
+        # up front instead of querying per user
+        existing_users = await self.crud.get_multi(
+            db, limit=-1, email=[user_data.email for user_data in data]
+        )
+        # email is unique, so each email maps to at most one row in either state
+        existing_users_by_email = {
+            existing_user.email: existing_user
+            for existing_user in existing_users["data"]
+        }
+
+        requested_role_uuids = {
+            user_data.email: [
+                role_uuid.strip() for role_uuid in user_data.role_uuid.split(",")
+            ]
+            for user_data in data
+        }
+        all_role_uuids = set().union(*requested_role_uuids.values())
+        all_roles = await role_crud.get_multi(db, limit=-1, uuid=list(all_role_uuids))
+        roles_by_uuid = {role.uuid: role for role in all_roles["data"]}
+
+        for user_data in data:
             # check if user already exists
-            db_user = await self.crud.get(db, email=user_data.email, soft_deleted=False)
-            if db_user:
+            existing_user = existing_users_by_email.get(user_data.email)
+            if existing_user and not existing_user.soft_deleted:
                 logger.error(f"{self.singular} already exists")
                 return bad_request_response(f"{self.singular} already exists")
 
-            soft_deleted_user = await self.crud.get(
-                db, email=user_data.email, soft_deleted=True
-            )
+            soft_deleted_user = existing_user
             if soft_deleted_user:
                 logger.info(
                     f"User {soft_deleted_user.email} already exists but soft deleted"
                 )
                 # restore the user
-                prev_user_data = soft_deleted_user.to_dict()
+                prev_user_data = user_snapshot(soft_deleted_user)
                 new_user = await self.crud.restore(
                     db,
                     db_obj=soft_deleted_user,
@@ -138,17 +227,19 @@ class UserRouter:
                         entity=self.singular,
                         action="update",
                         previous_data=prev_user_data,
-                        new_data=new_user.to_dict(),
+                        new_data=user_snapshot(new_user),
                         description=f"User {soft_deleted_user.email} restored successfully",
                     )
                 )
                 logger.info(f"User {soft_deleted_user.email} restored by {user.email}")
             # check for all the roles to be assigned
-            roles = await role_crud.get_multi(
-                db, limit=-1, uuid=user_data.role_uuid.split(",")
-            )
+            roles = [
+                roles_by_uuid[role_uuid]
+                for role_uuid in requested_role_uuids[user_data.email]
+                if role_uuid in roles_by_uuid
+            ]
 
-            if len(roles["data"]) != len(user_data.role_uuid.split(",")):
+            if len(roles) != len(requested_role_uuids[user_data.email]):
                 logger.error(f"All roles not found for {user_data.email}")
                 return bad_request_response(
                     f"All roles not found for {user_data.email}"
@@ -163,31 +254,33 @@ class UserRouter:
                         db, obj_in=user_data, user_uuid=user.uuid
                     )
                     logger.info(f"User {user_data.email} created successfully")
-                # Assign roles to the user
-                for role in roles["data"]:
-                    await user_roles_crud.create(
-                        db=db,
-                        obj_in=UserRoleCreateSchema(
+                # Assign all roles to the user in a single insert
+                await user_roles_crud.create_multi(
+                    db=db,
+                    objs_in=[
+                        UserRoleCreateSchema(
                             user_uuid=new_user.uuid, role_uuid=role.uuid
-                        ),
-                        user_uuid=user.uuid,
-                    )
-                    logger.info(f"Role {role.name} assigned to user {new_user.email}")
-
-                stmt = (
-                    select(User)
-                    .options(joinedload(User.roles))
-                    .where(User.uuid == user.uuid)
+                        )
+                        for role in roles
+                    ],
+                    user_uuid=user.uuid,
                 )
-
-                db_user: User = await self.crud.get(db=db, statement=stmt)
+                logger.info(
+                    f"Roles {[role.name for role in roles]} assigned to user {new_user.email}"
+                )
+            except IntegrityError:
+                # The email was taken by a concurrent request after the lookup
+                logger.error(f"{self.singular} already exists")
+                return bad_request_response(f"{self.singular} already exists")
             except Exception as e:
                 logger.error(f"Error creating {self.singular}: {str(e)}")
                 return bad_request_response(str(e))
 
             # Send an initialization email
-            initialize_url = f"{settings.FRONTEND_URL}/auth/initialize-account?email={urllib.parse.quote(new_user.email)}"
-            redis_lpush(
+            initialize_url = INITIALIZE_ACCOUNT_URL + urllib.parse.quote(
+                new_user.email, safe=""
+            )
+            await redis_push_async(
                 {
                     "queue_name": "notifications",
                     "operation": "send_email",
@@ -195,11 +288,9 @@ class UserRouter:
                         "to": new_user.email,
                         "subject": "Initialize your account",
                         "salutation": f"Hi,",
-                        "body": f"""
-                            <p>Welcome! Click the link below to initialize your account and set your password:</p>
-                            <p><a href="{initialize_url}">Initialize Account</a></p>
-                            <p>If you didn’t request this, you can safely ignore this email.</p>
-                        """,
+                        "body": INITIALIZE_ACCOUNT_EMAIL_BODY.format(
+                            url=initialize_url
+                        ),
                         "queue_name": "notifications",
                     },
                 }
@@ -230,7 +321,7 @@ class UserRouter:
             f"{settings.FRONTEND_URL}/initialize?email={urllib.parse.quote(email)}"
         )
 
-        redis_lpush(
+        await redis_push_async(
             {
                 "queue_name": "notifications",
                 "operation": "send_email",
@@ -238,11 +329,7 @@ class UserRouter:
                     "to": db_user.email,
                     "subject": "Initialize your account",
                     "salutation": f"Hi,",
-                    "body": f"""
-                    <p>Welcome! Click the link below to initialize your account and set your password:</p>
-                    <p><a href="{initialize_url}">Initialize Account</a></p>
-                    <p>If you didn’t request this, you can safely ignore this email.</p>
-                """,
+                    "body": INITIALIZE_ACCOUNT_EMAIL_BODY.format(url=initialize_url),
                     "queue_name": "notifications",
                 },
             }
@@ -261,44 +348,65 @@ class UserRouter:
     ):
         logger.info(f"Fetching {self.plural} with filters: {filters.__dict__}")
 
+        user_types = (
+            [role.strip() for role in filters.user_type.split(",")]
+            if filters.user_type is not None
+            else None
+        )
+        excluded_user_types = (
+            [role.strip() for role in filters.exclude_user_types.split(",")]
+            if filters.exclude_user_types is not None
+            else None
+        )
+
         query_filters = []
-        if filters.user_type is not None:
-            query_filters.append(
-                User.roles.any(
-                    Role.name.in_(
-                        [role.strip() for role in filters.user_type.split(",")]
-                    )
-                )
-            )
+        if user_types is not None:
+            query_filters.append(user_has_role(Role.name.in_(user_types)))
 
-        if filters.exclude_user_types is not None:
-            query_filters.append(
-                User.roles.any(
-                    Role.name.not_in(
-                        [role.strip() for role in filters.exclude_user_types.split(",")]
-                    )
-                )
-            )
+        if excluded_user_types is not None:
+            query_filters.append(user_has_role(Role.name.not_in(excluded_user_types)))
         if filters.has_dashboard_access is not None:
             query_filters.append(
-                User.roles.any(
-                    Role.has_dashboard_access == filters.has_dashboard_access
-                )
+                user_has_role(Role.has_dashboard_access == filters.has_dashboard_access)
+            )
+
+        seek_filters = []
+        kwargs = filters.to_kwargs()
+        # Newest-first listing pages by keyset: a cursor seeks straight past
+        # the previous page instead of making the database skip OFFSET rows
+        keyset = filters.cursor is not None or filters.sort == "created_at:desc"
+        if keyset:
+            kwargs["sort"] = "created_at:desc,uuid:desc"
+        if filters.cursor is not None:
+            try:
+                cursor_created_at, cursor_uuid = decode_user_cursor(filters.cursor)
+            except ValueError:
+                return bad_request_response("Invalid cursor")
+            # Kept out of query_filters so total_count still covers every match
+            seek_filters.append(
+                tuple_(User.created_at, User.uuid)
+                < tuple_(cursor_created_at, cursor_uuid)
             )
+            kwargs["skip"] = 0
 
         users = await self.crud.get_multi_with_cache(
             db,
-            unique_records=True,
             query_filters=query_filters,
-            **filters.model_dump(),
+            seek_filters=seek_filters,
+            # The list never shows the password hash, so don't fetch or cache it
+            eager_load=[defer(User.password)],
+            **kwargs,
         )
         logger.info(f"Fetched {len(users['data'])} {self.plural}")
-        return {
+        content = {
             "status": status.HTTP_200_OK,
             "detail": "Users fetched successfully",
             "total_count": users["total_count"],
             "data": users["data"],
         }
+        if keyset and users["data"] and len(users["data"]) == filters.limit:
+            content["next_cursor"] = encode_user_cursor(users["data"][-1])
+        return json_response(USER_LIST_RESPONSE_ADAPTER, content, exclude_unset=True)
 
     async def get(
         self,
@@ -307,8 +415,7 @@ class UserRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         logger.info(f"Fetching {self.singular} with uuid: {uuid}")
-        stmt = select(User).options(joinedload(User.roles)).where(User.uuid == uuid)
-        db_user = await self.crud.get(db, statement=stmt)
+        db_user = await self.crud.get(db, statement=select_user_with_roles(uuid))
         if not db_user:
             logger.error(f"{self.singular} with uuid {uuid} not found")
             return not_found_response(f"{self.singular} not found")
@@ -326,8 +433,7 @@ class UserRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         logger.info(f"Updating {self.singular} with uuid: {uuid}")
-        stmt = select(User).options(joinedload(User.roles)).where(User.uuid == uuid)
-        db_user: User = await self.crud.get(db, statement=stmt)
+        db_user: User = await self.crud.get(db, statement=select_user_with_roles(uuid))
         if not db_user:
             logger.error(f"{self.singular} with uuid {uuid} not found")
             return not_found_response(f"{self.singular} not found")
@@ -368,14 +474,19 @@ class UserRouter:
                 if role.name != "user" and role.uuid != check_user_role.role_uuid
             ]
             if roles_to_remove:
-                await user_roles_crud.remove_multi(
+                removed = await user_roles_crud.remove_multi(
                     db, user_uuid=uuid, role_uuid=roles_to_remove
                 )
-
-                await db.refresh(db_user)
+                removed_role_uuids = {user_role.role_uuid for user_role in removed}
+                db_user.roles = [
+                    role
+                    for role in db_user.roles
+                    if role.uuid not in removed_role_uuids
+                ]
                 logger.info(
                     f"Removed roles {roles_to_remove} from user {db_user.email}"
                 )
+            await invalidate_user_permissions_async(db_user.uuid)
         try:
             del data.role_uuid
             updated_user = await self.crud.update(
@@ -386,10 +497,7 @@ class UserRouter:
             return bad_request_response(str(e))
         logger.info(f"{self.singular} with uuid {uuid} updated successfully")
         user_updated = await self.crud.get(
-            db,
-            statement=select(User)
-            .options(joinedload(User.roles))
-            .where(User.uuid == updated_user.uuid),
+            db, statement=select_user_with_roles(updated_user.uuid)
         )
         return success_response(
             message=f"{self.singular} updated successfully", data=user_updated
@@ -401,10 +509,8 @@ class UserRouter:
         user: User = Depends(get_user_with_permission("can_delete_users")),
         db: AsyncSession = Depends(get_async_session),
     ):
-        stmt = (
-            select(User)
-            .options(joinedload(User.roles))
-            .where(and_(User.uuid == uuid, User.soft_deleted == False))
+        stmt = select_user_with_roles(uuid) + (
+            lambda s: s.where(User.soft_deleted == False)
         )
         db_user: User = await self.crud.get(db, statement=stmt)
 
@@ -412,8 +518,7 @@ class UserRouter:
             logger.error(f"{self.singular} with uuid {uuid} not found")
             return not_found_response(f"{self.singular} not found")
 
-        prev_data = db_user.to_dict()
-        prev_data.pop("password", None)
+        prev_data = user_snapshot(db_user)
         logger.critical(f"{self.singular} to be deleted: {db_user} by user {user.uuid}")
         if db_user.delete_protection:
             logger.error(
@@ -429,29 +534,32 @@ class UserRouter:
                 "Why do you want to delete yourself? Let another admin do that!"
             )
 
-        # Delete user roles
-        await user_roles_crud.remove_multi(db, user_uuid=uuid)
-        await db.refresh(db_user)
+        # Drop the role rows in one statement; soft_delete commits it together
+        # with the user update, so a failure leaves both untouched.
+        await db.execute(delete(UserRole).where(UserRole.user_uuid == uuid))
+        db_user.roles = []
         await self.crud.soft_delete(
             db,
             db_obj=db_user,
             extra_fields={"is_verified": False, "verified_at": None, "password": None},
         )
+        await user_roles_crud.invalidate_cache()
 
         logger.critical(
             f"{self.singular} {uuid} deleted successfully by user {user.uuid}"
         )
 
-        await activity_log_crud.create(
-            db=db,
-            obj_in=ActivityLogCreateSchema(
-                user_uuid=user.uuid,
-                entity=self.singular,
-                action="delete",
-                previous_data=prev_data,
-                new_data={},
-                description=f"{self.singular} deleted successfully",
-            ),
+        await activity_log_crud.enqueue(
+            [
+                ActivityLogCreateSchema(
+                    user_uuid=user.uuid,
+                    entity=self.singular,
+                    action="delete",
+                    previous_data=prev_data,
+                    new_data={},
+                    description=f"{self.singular} deleted successfully",
+                )
+            ]
         )
         return success_response(message=f"{self.singular} deleted successfully")
 
@@ -463,12 +571,10 @@ class UserRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         role_uuid = [role.strip() for role in role_uuid.split(",")]
-        stmt = (
-            select(User).options(joinedload(User.roles)).where(User.uuid == user_uuid)
+        db_user: User = await self.crud.get(
+            db, statement=select_user_with_roles(user_uuid)
         )
 
-        db_user: User = await self.crud.get(db, statement=stmt)
-
         if not db_user:
             logger.error(f"{self.singular} with uuid {user_uuid} not found")
             return not_found_response(f"{self.singular} not found")
@@ -476,19 +582,36 @@ class UserRouter:
         logger.critical(
             f"{self.singular} roles to be removed: {db_user} by user {user.uuid}"
         )
-        for role in db_user.roles:
-            if role.name != "user" and role.uuid in role_uuid:
-                user_role = await user_roles_crud.get(
-                    db, user_uuid=user_uuid, role_uuid=role.uuid
-                )
-                if user_role.user_uuid == user.uuid:
-                    logger.critical(
-                        f"{self.singular} role to be removed: You cannot remove your own role. Role: {role.uuid} User: {user.uuid}"
-                    )
-                    return bad_request_response(
-                        f"You cannot remove your own role. Role: {role.uuid} User: {user.uuid}"
+        roles_to_remove = [
+            role.uuid
+            for role in db_user.roles
+            if role.name != "user" and role.uuid in role_uuid
+        ]
+        if roles_to_remove and db_user.uuid == user.uuid:
+            logger.critical(
+                f"{self.singular} role to be removed: You cannot remove your own role. Role: {roles_to_remove[0]} User: {user.uuid}"
+            )
+            return bad_request_response(
+                f"You cannot remove your own role. Role: {roles_to_remove[0]} User: {user.uuid}"
+            )
+        if roles_to_remove:
+            removed = await user_roles_crud.remove_multi(
+                db, user_uuid=user_uuid, role_uuid=roles_to_remove
+            )
+            await activity_log_crud.enqueue(
+                [
+                    ActivityLogCreateSchema(
+                        user_uuid=user.uuid,
+                        entity=user_roles_crud.singular,
+                        action="delete",
+                        previous_data=user_role.to_dict(),
+                        new_data={},
+                        description=f"{user_roles_crud.model_name} with identifier {user_role.uuid} deleted successfully",
                     )
-                await user_roles_crud.remove(db, db_obj=user_role, user_uuid=user.uuid)
+                    for user_role in removed
+                ]
+            )
+        await invalidate_user_permissions_async(db_user.uuid)
 
         logger.critical(
             f"{self.singular} roles {role_uuid} removed successfully by user {user.uuid}"
@@ -6,6 +6,16 @@ from app.core.config import settings
 
 docs_router = APIRouter()
 
+# The docs pages only depend on settings, so render them once at import time
+SWAGGER_UI_HTML = get_swagger_ui_html(
+    openapi_url="/openapi.json", title=f"{settings.APP_NAME.upper()} API - docs"
+).body
+REDOC_HTML = get_redoc_html(
+    openapi_url="/openapi.json", title=f"{settings.APP_NAME.upper()} API - redoc"
+).body
+# Docs are behind basic auth, so only allow private (browser) caching
+DOCS_CACHE_HEADERS = {"Cache-Control": "private, max-age=3600"}
+
 
 # Swagger UI
 @docs_router.get(
@@ -16,9 +26,7 @@ docs_router = APIRouter()
     description=f"Protected Swagger UI for interacting with the {settings.APP_NAME.upper()} API documentation.",
 )
 async def get_docs(username: str = Depends(get_current_docs_user)):
-    return get_swagger_ui_html(
-        openapi_url="/openapi.json", title=f"{settings.APP_NAME.upper()} API - docs"
-    )
+    return HTMLResponse(content=SWAGGER_UI_HTML, headers=DOCS_CACHE_HEADERS)
 
 
 # ReDoc
@@ -30,6 +38,4 @@ async def get_docs(username: str = Depends(get_current_docs_user)):
     description=f"Protected ReDoc interface for viewing the {settings.APP_NAME.upper()} API documentation in a clean format.",
 )
 async def get_redoc(username: str = Depends(get_current_docs_user)):
-    return get_redoc_html(
-        openapi_url="/openapi.json", title=f"{settings.APP_NAME.upper()} API - redoc"
-    )
+    return HTMLResponse(content=REDOC_HTML, headers=DOCS_CACHE_HEADERS)
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.utils.generate_slug import generate_unique_slug
 from app.utils.responses import (
@@ -17,6 +19,7 @@ from app.schemas.countries import (
     CountryFilters,
 )
 from app.cruds.countries import country_crud
+from app.models.countries import Country
 from app.models.users import User
 from app.database.get_session import get_async_session
 from app.core.loggers import app_logger as logger
@@ -83,9 +86,9 @@ class CountryRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         """Get all countries with optional filtering"""
-        logger.info(f"Listing {self.plural} with filters: {filters} ")
+        logger.info("Listing %s with filters: %s", self.plural, filters)
 
-        countries = await self.crud.get_multi(
+        countries = await self.crud.get_multi_with_cache(
             db=db, **filters.model_dump(exclude_none=True)
         )
 
@@ -103,24 +106,26 @@ class CountryRouter:
     ):
         """Create a new country"""
         logger.info(
-            f"Creating {self.singular} with data: {country_data} and user: {user.uuid}"
+            "Creating %s with data: %s and user: %s",
+            self.singular,
+            country_data,
+            user.uuid,
         )
 
-        # Check if country with same name already exists
-        existing_country = await self.crud.get(
-            db=db, name=country_data.name.capitalize()
-        )
-        if existing_country:
-            raise bad_request_response(
-                message=f"Country {country_data.name} already exists",
-            )
         slug = await generate_unique_slug(db, self.crud, country_data.name)
 
-        country_create = CountryCreateSchema(
-            name=country_data.name.capitalize(), slug=slug
-        )
+        country_create = CountryCreateSchema(name=country_data.name, slug=slug)
 
-        country = await self.crud.create(db=db, obj_in=country_create)
+        try:
+            country = await self.crud.create(db=db, obj_in=country_create)
+        except RuntimeError as e:
+            logger.error("Error creating %s: %s", self.singular, e)
+            # The case-insensitive unique name index rejects duplicate countries
+            if isinstance(e.__cause__, IntegrityError):
+                raise bad_request_response(
+                    message=f"Country {country_data.name} already exists",
+                )
+            raise bad_request_response(message=str(e))
 
         return created_response(
             message=f"Successfully created {self.singular}!",
@@ -133,9 +138,9 @@ class CountryRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         """Get a country by UUID"""
-        logger.info(f"Getting {self.singular} with id: {id} ")
+        logger.info("Getting %s with id: %s", self.singular, id)
 
-        country = await self.crud.get(db=db, id=id)
+        country = await self.crud.get_with_cache(db=db, identifier=id)
         if not country:
             return not_found_response(f"{self.singular} not found!")
 
@@ -151,23 +156,41 @@ class CountryRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         """Update a country"""
-        logger.info(f"Updating {self.singular} with ID: {id} and user: {user.uuid}")
+        logger.info(
+            "Updating %s with ID: %s and user: %s", self.singular, id, user.uuid
+        )
 
-        country = await self.crud.get(db=db, id=id)
+        # Load the country and any other country holding the new name in one query
+        query_filters = [Country.id == id]
+        if country_data.name:
+            query_filters.append(
+                func.lower(Country.name) == func.lower(country_data.name)
+            )
+        result = await db.execute(select(Country).where(or_(*query_filters)))
+        matches = result.scalars().all()
+
+        country = next((match for match in matches if match.id == id), None)
         if not country:
             return not_found_response(f"{self.singular} not found!")
 
         # Check if new name conflicts with existing country
-        if country_data.name and country_data.name.lower() != country.name.lower():
-            existing_country = await self.crud.get(db=db, name=country_data.name)
-            if existing_country:
+        if any(match.id != id for match in matches):
+            raise bad_request_response(
+                message="Country with this name already exists",
+            )
+
+        try:
+            updated_country = await self.crud.update(
+                db=db, db_obj=country, obj_in=country_data
+            )
+        except RuntimeError as e:
+            logger.error("Error updating %s: %s", self.singular, e)
+            # A concurrent rename can still trip the unique name index
+            if isinstance(e.__cause__, IntegrityError):
                 raise bad_request_response(
                     message="Country with this name already exists",
                 )
-
-        updated_country = await self.crud.update(
-            db=db, db_obj=country, obj_in=country_data
-        )
+            raise bad_request_response(message=str(e))
 
         return success_response(
             message=f"Successfully updated {self.singular}!", data=updated_country
@@ -180,7 +203,9 @@ class CountryRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         """Delete a country"""
-        logger.info(f"Deleting {self.singular} with ID: {id} and user: {user.uuid}")
+        logger.info(
+            "Deleting %s with ID: %s and user: %s", self.singular, id, user.uuid
+        )
 
         country = await self.crud.get(db=db, id=id)
         if not country:
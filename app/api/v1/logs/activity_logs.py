@@ -1,18 +1,27 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.utils.responses import not_found_response
+from sqlalchemy.orm import selectinload
+from app.utils.responses import json_response, not_found_response
 from app.deps.user import get_user_with_permission
 from app.schemas.activity_logs import (
     ActivityLogResponseSchema,
     ActivityLogTotalCountListResponseSchema,
     ActivityLogFilters,
+    ActivityLogSchema,
 )
 from app.models.activity_logs import ActivityLog
 from app.cruds.activity_logs import activity_log_crud
 from app.models.users import User
-from app.database.get_session import get_async_session
+from app.database.get_session import AsyncSessionLocal, get_async_session
 from app.core.loggers import app_logger as logger
 
+ACTIVITY_LOG_ADAPTER = TypeAdapter(ActivityLogSchema)
+ACTIVITY_LOG_LIST_RESPONSE_ADAPTER = TypeAdapter(
+    ActivityLogTotalCountListResponseSchema
+)
+
 
 class ActivityLogRouter:
     def __init__(self):
@@ -27,7 +36,8 @@ class ActivityLogRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
             description="Get all activity logs",
             summary="Get all activity logs",
         )
@@ -47,7 +57,7 @@ class ActivityLogRouter:
         db: AsyncSession = Depends(get_async_session),
     ):
         logger.info(
-            f"Listing {self.plural} with filters: {filters} and user: {user.uuid}"
+            "Listing %s with filters: %s and user: %s", self.plural, filters, user.uuid
         )
 
         main_filters = {}
@@ -60,44 +70,85 @@ class ActivityLogRouter:
             main_filters["action"] = filters.action
 
         if filters.exclude_actions:
-            query_filters.append(
-                ActivityLog.action.not_in(filters.exclude_actions.split(","))
-            )
+            exclude_actions = [
+                action.strip()
+                for action in filters.exclude_actions.split(",")
+                if action.strip()
+            ]
+            if exclude_actions:
+                query_filters.append(ActivityLog.action.not_in(exclude_actions))
 
         if filters.include_actions:
-            main_filters["action"] = filters.include_actions.split(",")
-            query_filters.append(
-                ActivityLog.action.in_(filters.include_actions.split(","))
-            )
+            include_actions = [
+                action.strip()
+                for action in filters.include_actions.split(",")
+                if action.strip()
+            ]
+            if include_actions:
+                query_filters.append(ActivityLog.action.in_(include_actions))
 
         if filters.entity:
             main_filters["entity"] = filters.entity
 
+        # Apply both ends of the date range so the created_at index bounds the scan
+        created_at_range = {}
         if filters.start_date:
-            main_filters["created_at"] = {"gte": filters.start_date}
+            created_at_range["gte"] = filters.start_date
 
         if filters.end_date:
-            main_filters["created_at"] = {"lte": filters.end_date}
+            created_at_range["lte"] = filters.end_date
+
+        if created_at_range:
+            main_filters["range_filters"] = {"created_at": created_at_range}
 
         if filters.search:
             main_filters["search"] = filters.search
 
+        if filters.format == "ndjson":
+            return StreamingResponse(
+                self._stream_ndjson(
+                    skip=filters.skip,
+                    limit=filters.limit,
+                    sort=filters.sort,
+                    query_filters=query_filters,
+                    **main_filters,
+                ),
+                media_type="application/x-ndjson",
+            )
+
         activity_logs = await self.crud.get_multi(
             db=db,
             skip=filters.skip,
             limit=filters.limit,
             sort=filters.sort,
-            eager_load=[ActivityLog.user],
+            # Many logs share few users; load each user once with an IN query
+            eager_load=[selectinload(ActivityLog.user)],
             query_filters=query_filters,
             **main_filters,
         )
 
-        return {
-            "status": status.HTTP_200_OK,
-            "detail": f"Successfully fetched {self.plural}!",
-            "total_count": activity_logs["total_count"],
-            "data": activity_logs["data"],
-        }
+        return json_response(
+            ACTIVITY_LOG_LIST_RESPONSE_ADAPTER,
+            {
+                "status": status.HTTP_200_OK,
+                "detail": f"Successfully fetched {self.plural}!",
+                "total_count": activity_logs["total_count"],
+                "data": activity_logs["data"],
+            },
+        )
+
+    async def _stream_ndjson(self, **kwargs):
+        """Yield activity logs one JSON document per line."""
+        # The request session is closed once the handler returns, so the
+        # stream holds its own session for as long as the client is reading
+        async with AsyncSessionLocal() as db:
+            async for activity_log in self.crud.stream_multi(
+                db, eager_load=[selectinload(ActivityLog.user)], **kwargs
+            ):
+                log = ACTIVITY_LOG_ADAPTER.validate_python(
+                    activity_log, from_attributes=True
+                )
+                yield ACTIVITY_LOG_ADAPTER.dump_json(log) + b"\n"
 
     async def get(
         self,
@@ -105,7 +156,7 @@ class ActivityLogRouter:
         user: User = Depends(get_user_with_permission("can_read_logs")),
         db: AsyncSession = Depends(get_async_session),
     ):
-        logger.info(f"Getting {self.singular} with ID: {id} and user: {user.uuid}")
+        logger.info("Getting %s with ID: %s and user: %s", self.singular, id, user.uuid)
 
         activity_log = await self.crud.get(db=db, id=id)
 
@@ -1,10 +1,13 @@
+import re
 from fastapi import APIRouter, Depends, HTTPException, status
 from meilisearch.errors import MeilisearchApiError
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from app.utils.responses import (
     success_response,
     not_found_response,
     bad_request_response,
+    json_response,
 )
 from app.deps.user import get_user_with_permission
 from app.schemas.logs import (
@@ -15,11 +18,23 @@ from app.schemas.logs import (
 )
 from app.services.meili_search import MeiliSearchService
 from app.services.logs_service import LogService
+from app.services.cache_service import async_cache_service
 from app.models.users import User
-from app.database.get_session import get_async_session
 from app.core.loggers import app_logger as logger
 from app.core.config import settings
 
+LOG_LIST_RESPONSE_ADAPTER = TypeAdapter(LogTotalCountListResponseSchema)
+LOG_SORT_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*):(asc|desc)$")
+LOG_SORT_FIELDS = frozenset(
+    {"id", "timestamp", "level", "service", "logger_name", "message"}
+)
+
+
+def quote_filter_value(value: str) -> str:
+    """Quote a value for a MeiliSearch filter, escaping backslashes and quotes."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
 
 class SystemLogRouter:
     def __init__(self):
@@ -49,7 +64,8 @@ class SystemLogRouter:
             "/",
             self.list,
             methods=["GET"],
-            response_model=self.response_list_model,
+            response_model=None,
+            responses={200: {"model": self.response_list_model}},
             description="Get all logs",
             summary="Get all logs",
         )
@@ -66,21 +82,20 @@ class SystemLogRouter:
         self,
         filters: LogFilters = Depends(),
         user: User = Depends(get_user_with_permission("can_read_logs")),
-        db: AsyncSession = Depends(get_async_session),
     ):
         try:
             conditions = []
             sort_param = []
 
             if filters.sort:
-                try:
-                    sort = filters.sort.split(",")
-                    for s in sort:
-                        field, direction = s.split(":")
-                        if direction not in ["asc", "desc"]:
-                            raise ValueError("Invalid sort direction")
-                        sort_param.append(f"{field}:{direction}")
-                except ValueError:
+                sort = filters.sort.split(",")
+                sort_param = [
+                    s
+                    for s in sort
+                    if (match := LOG_SORT_RE.match(s))
+                    and match.group(1) in LOG_SORT_FIELDS
+                ]
+                if len(sort_param) != len(sort):
                     return bad_request_response(
                         message="Invalid sort format. Use 'field:asc' or 'field:desc'."
                     )
@@ -93,68 +108,85 @@ class SystemLogRouter:
 
             # Exact match filters
             if filters.message:
-                conditions.append(f"message = '{filters.message}'")
+                conditions.append(f"message = {quote_filter_value(filters.message)}")
             if filters.level:
-                conditions.append(f"level = '{filters.level}'")
+                conditions.append(f"level = {quote_filter_value(filters.level)}")
             if filters.service:
-                conditions.append(f"service = '{filters.service}'")
+                conditions.append(f"service = {quote_filter_value(filters.service)}")
             if filters.logger_name:
-                conditions.append(f"logger_name = '{filters.logger_name}'")
+                conditions.append(
+                    f"logger_name = {quote_filter_value(filters.logger_name)}"
+                )
 
             if filters.id:
                 id_list = filters.id.split(",")
                 # Format for MeiliSearch: id IN ['id1', 'id2']
                 # Format for LogService: id IN ['id1', 'id2']
-                id_list_str = ", ".join([f"'{id.strip()}'" for id in id_list])
+                id_list_str = ", ".join(
+                    [quote_filter_value(id.strip()) for id in id_list]
+                )
                 conditions.append(f"id IN [{id_list_str}]")
 
             # Combine all filters
             main_filters = " AND ".join(conditions) if conditions else None
             if main_filters:
-                logger.info(f"Main log filters: {main_filters}")
-            result = self.logs_service.search(
-                query=filters.search or "",
-                offset=filters.skip,
-                limit=filters.limit,
-                filters=main_filters,
-                sort=sort_param,
-            )
-            logger.info(f"Logs fetched successfully by user {user.uuid}")
-            return {
-                "status": status.HTTP_200_OK,
-                "detail": f"{self.plural} fetched successfully",
-                "total_count": result["estimatedTotalHits"],
-                "data": result["hits"],
+                logger.info("Main log filters: %s", main_filters)
+            search_params = {
+                "query": filters.search or "",
+                "offset": filters.skip,
+                "limit": filters.limit,
+                "filters": main_filters,
+                "sort": sort_param,
             }
+            cache_key = async_cache_service.get_list_cache_key("logs", **search_params)
+            result = await async_cache_service.get(cache_key)
+            if not result:
+                # Both log backends are blocking; keep them off the event loop
+                result = await run_in_threadpool(
+                    self.logs_service.search, **search_params
+                )
+                await async_cache_service.set(
+                    cache_key, result, settings.CACHE_TTL_SHORT
+                )
+            logger.info("Logs fetched successfully by user %s", user.uuid)
+            return json_response(
+                LOG_LIST_RESPONSE_ADAPTER,
+                {
+                    "status": status.HTTP_200_OK,
+                    "detail": f"{self.plural} fetched successfully",
+                    "total_count": result["estimatedTotalHits"],
+                    "data": result["hits"],
+                },
+                from_attributes=False,
+            )
         except MeilisearchApiError as e:
-            logger.error(f"Error fetching logs from MeiliSearch: {e}")
+            logger.error("Error fetching logs from MeiliSearch: %s", e)
             return bad_request_response(message="Error fetching logs")
         except Exception as e:
-            logger.error(f"Error fetching logs: {e}")
+            logger.error("Error fetching logs: %s", e)
             return bad_request_response(message="Error fetching logs")
 
     async def get(
         self,
         id: str,
         user: User = Depends(get_user_with_permission("can_read_logs")),
-        db: AsyncSession = Depends(get_async_session),
     ):
-        logger.info(f"User {user.uuid} is fetching log with ID {id}")
+        logger.info("User %s is fetching log with ID %s", user.uuid, id)
         try:
-            log = self.logs_service.get_one(id)
+            log = await run_in_threadpool(self.logs_service.get_one, id)
             if not log:
                 return not_found_response(
                     message=f"{self.singular} with ID {id} not found"
                 )
-            logger.info(f"Log {id} fetched successfully by user {user.uuid}")
+            logger.info("Log %s fetched successfully by user %s", id, user.uuid)
             # Handle both dict (LogService) and object (MeiliSearch) responses
             log_data = log if isinstance(log, dict) else log.__dict__
             return success_response(
                 data=log_data, message=f"{self.singular} fetched successfully"
             )
         except MeilisearchApiError as e:
-            logger.error(f"Error fetching log from MeiliSearch: {e}")
+            logger.error("Error fetching log from MeiliSearch: %s", e)
             return bad_request_response(message="Error fetching log")
         except Exception as e:
-            logger.error(f"Error fetching log: {e}")
+            logger.error("Error fetching log: %s", e)
             return bad_request_response(message="Error fetching log")
@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     OPENAPI_SERVERS: list = OPENAPI_SERVERS
 
     ENV: str = "local"
+    # Threshold for the application loggers (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    LOG_LEVEL: str = "DEBUG"
 
     SERVICE_NAME: str = "ktechhub"
     DOMAIN: str = "ktechhub.com"
@@ -42,6 +44,12 @@ class Settings(BaseSettings):
     DATABASE_URL: str = ""
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection
+    # Compiled-statement LRU; each filter/sort/eager-load combination is its own entry
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Raise on any lazy load in list and user queries; enable in tests/staging to catch N+1s
+    DB_RAISELOAD: bool = False
 
     REDIS_PORT: int = 6379
     REDIS_HOST: str = "localhost"
@@ -57,6 +65,7 @@ class Settings(BaseSettings):
     CACHE_TTL_MEDIUM: int = 1800  # 30 minutes
     CACHE_TTL_LONG: int = 3600  # 1 hour
     CACHE_TTL_VERY_LONG: int = 86400  # 24 hours
+    AUTH_LOCAL_CACHE_TTL: int = 30  # per-worker authenticated user cache, 0 disables
 
     # JWT Settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
@@ -1,4 +1,9 @@
-ALLOWED_IMAGE_EXTENSIONS = ["png", "jpg", "jpeg"]
+ALLOWED_IMAGE_EXTENSIONS = frozenset({"png", "jpg", "jpeg"})
+# Leading bytes of each allowed image format
+IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpeg",
+}
 DISPOSABLE_EMAIL_DOMAINS = {
     "example.com",
     "thunkinator.org",
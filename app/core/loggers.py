@@ -1,11 +1,18 @@
 import logging
 import os
+import queue
 import sys
+import threading
 import time
 import meilisearch
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from .config import settings
 
+# Log entries waiting for Meilisearch; entries beyond this are dropped
+MEILI_QUEUE_SIZE = 10000
+MEILI_BATCH_SIZE = 500
+MEILI_FLUSH_INTERVAL = 1  # seconds
+
 
 class TimedRotatingFileHandlerWithSize(TimedRotatingFileHandler):
     """
@@ -95,7 +102,10 @@ class SetupLogger:
             os.makedirs("logs")
 
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(settings.LOG_LEVEL.upper())
+        # Read once instead of on every Meilisearch entry
+        self._logger_name = logger_name
+        self._service_name = settings.SERVICE_NAME
 
         # Log format
         log_format = logging.Formatter(
@@ -142,45 +152,95 @@ class SetupLogger:
             self.meili_index.update_sortable_attributes(
                 ["timestamp", "level", "service", "logger_name"]
             )
+            # Ship entries from a background thread so a log call never
+            # waits on a Meilisearch request
+            self._meili_queue = queue.Queue(maxsize=MEILI_QUEUE_SIZE)
+            threading.Thread(
+                target=self._flush_to_meilisearch,
+                name=f"{logger_name}-meilisearch",
+                daemon=True,
+            ).start()
         else:
             self.meili_enabled = False
 
-    def _log_to_meilisearch(self, level, message):
+    def _log_to_meilisearch(self, level, message, *args):
         """
-        Logs the message to Meilisearch if enabled.
+        Queues the message for Meilisearch; callers check meili_enabled.
         """
-        if not self.meili_enabled:
-            return
+        if args:
+            message = message % args
 
+        now_ns = time.time_ns()
         log_entry = {
-            "id": f"{int(time.time() * 1000)}-{level}-{settings.SERVICE_NAME}",  # Unique ID using timestamp
-            "timestamp": int(time.time()),  # UNIX timestamp
+            # Nanoseconds keep entries from the same millisecond from
+            # overwriting each other within a batch
+            "id": f"{now_ns}-{level}-{self._service_name}",
+            "timestamp": now_ns // 1_000_000_000,  # UNIX timestamp
             "level": level,
             "message": message,
-            "service": settings.SERVICE_NAME,
-            "logger_name": self.logger.name,
+            "service": self._service_name,
+            "logger_name": self._logger_name,
         }
-        self.meili_index.add_documents([log_entry])
+        try:
+            self._meili_queue.put_nowait(log_entry)
+        except queue.Full:
+            # Meilisearch is not keeping up; the file and console logs still have it
+            pass
 
-    def info(self, message):
-        self.logger.info(message)
-        self._log_to_meilisearch("INFO", message)
+    def _flush_to_meilisearch(self):
+        """
+        Sends queued log entries to Meilisearch in batches, forever.
+        """
+        while True:
+            batch = [self._meili_queue.get()]
+            # Let the rest of a burst arrive so it goes out in one request
+            time.sleep(MEILI_FLUSH_INTERVAL)
+            while len(batch) < MEILI_BATCH_SIZE:
+                try:
+                    batch.append(self._meili_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.meili_index.add_documents(batch)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to send %s log entries to Meilisearch: %s", len(batch), e
+                )
 
-    def warning(self, message):
-        self.logger.warning(message)
-        self._log_to_meilisearch("WARNING", message)
+    def info(self, message, *args):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(message, *args)
+        if self.meili_enabled:
+            self._log_to_meilisearch("INFO", message, *args)
 
-    def error(self, message):
-        self.logger.error(message)
-        self._log_to_meilisearch("ERROR", message)
+    def warning(self, message, *args):
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning(message, *args)
+        if self.meili_enabled:
+            self._log_to_meilisearch("WARNING", message, *args)
 
-    def debug(self, message):
-        self.logger.debug(message)
-        self._log_to_meilisearch("DEBUG", message)
+    def error(self, message, *args):
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error(message, *args)
+        if self.meili_enabled:
+            self._log_to_meilisearch("ERROR", message, *args)
 
-    def critical(self, message):
-        self.logger.critical(message)
-        self._log_to_meilisearch("CRITICAL", message)
+    def debug(self, message, *args):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(message, *args)
+        if self.meili_enabled:
+            self._log_to_meilisearch("DEBUG", message, *args)
+
+    def critical(self, message, *args):
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        self.logger.critical(message, *args)
+        if self.meili_enabled:
+            self._log_to_meilisearch("CRITICAL", message, *args)
 
 
 # Create Base loggers with both rotation types
@@ -1,5 +1,6 @@
 import json
 from typing import Dict, Optional, Type, TypeVar, Union, Any, List
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from ..schemas.activity_logs import ActivityLogCreateSchema
@@ -7,7 +8,6 @@ from .activity_logs import activity_log_crud
 from .base import CRUDBase
 from ..core.loggers import app_logger as logger
 from ..core.config import settings
-from app.services.redis_push import redis_push_async
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -22,8 +22,22 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def __init__(self, model: Type[ModelType], ttl: int = settings.CACHE_TTL_MEDIUM):
         super().__init__(model, ttl=ttl)
+        # model_name (the same lowercase name) is already set by CacheMixin
         self.singular = model.__name__.lower()
-        self.model_name = model.__name__.lower()
+        # Never log writes to the activity log itself
+        self._skip_log = model.__name__ == "ActivityLog"
+        self._has_to_dict = hasattr(model, "to_dict")
+        # Activity descriptions; only the identifier varies per call
+        self._desc_created = (
+            f"{self.model_name} with identifier {{}} created successfully"
+        )
+        self._desc_updated = (
+            f"{self.model_name} with identifier {{}} updated successfully"
+        )
+        self._desc_deleted = (
+            f"{self.model_name} with identifier {{}} deleted successfully"
+        )
+        self._desc_created_multi = f"{self.model_name} created successfully"
 
     def _get_identifier(self, db_obj: ModelType) -> str:
         """Get the identifier (uuid or id) from the database object."""
@@ -40,8 +54,7 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
         description: Optional[str] = None,
     ) -> None:
         """Create an activity log entry."""
-        # Skip logging if the model is ActivityLog to prevent infinite recursion
-        if self.model_name == "ActivityLog":
+        if self._skip_log:
             return
         if user_uuid is None:
             logger.warning(f"User UUID is None for {self.singular}")
@@ -57,20 +70,18 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
             #         description=description,
             #     ),
             # )
-        message = {
-            "queue_name": "activity_logs",
-            "operation": "create",
-            "log": False,
-            "data": ActivityLogCreateSchema(
-                user_uuid=user_uuid,
-                entity=self.singular,
-                action=action,
-                previous_data=previous_data or {},
-                new_data=new_data or {},
-                description=description,
-            ).model_dump(),
-        }
-        await redis_push_async(message=message, log=False)
+        await activity_log_crud.enqueue(
+            [
+                ActivityLogCreateSchema(
+                    user_uuid=user_uuid,
+                    entity=self.singular,
+                    action=action,
+                    previous_data=previous_data or {},
+                    new_data=new_data or {},
+                    description=description,
+                )
+            ]
+        )
 
     async def create(
         self,
@@ -86,7 +97,12 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
             obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        await db.commit()
+        try:
+            await db.commit()
+        except Exception:
+            # Leave the session usable when a unique constraint rejects the row
+            await db.rollback()
+            raise
         await db.refresh(db_obj)
 
         if user_uuid is not None:
@@ -95,13 +111,11 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
                 db=db,
                 user_uuid=user_uuid,
                 action="create",
-                new_data=(
-                    db_obj.to_dict() if hasattr(db_obj, "to_dict") else obj_in_data
-                ),
-                description=f"{self.model_name} with identifier {self._get_identifier(db_obj)} created successfully",
+                new_data=db_obj.to_dict() if self._has_to_dict else obj_in_data,
+                description=self._desc_created.format(self._get_identifier(db_obj)),
             )
 
-        await self.invalidate_cache()
+        await self.invalidate_rows_cache()
 
         return db_obj
 
@@ -121,19 +135,14 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
                     entity=self.singular,
                     action="create",
                     previous_data={},
-                    new_data=(
-                        db_obj.to_dict() if hasattr(db_obj, "to_dict") else db_obj
-                    ),
-                    description=f"{self.model_name} created successfully",
+                    new_data=db_obj.to_dict() if self._has_to_dict else db_obj,
+                    description=self._desc_created_multi,
                 )
                 for db_obj in db_objs
             ]
-            await activity_log_crud.create_multi(
-                db=db,
-                objs_in=activity_logs,
-            )
+            await activity_log_crud.enqueue(activity_logs)
 
-        await self.invalidate_cache()
+        await self.invalidate_rows_cache()
         return db_objs
 
     async def update(
@@ -153,13 +162,30 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not allow_null:
             update_data = {k: v for k, v in update_data.items() if v is not None}
 
-        # Store previous data for logging
-        previous_data = db_obj.to_dict() if hasattr(db_obj, "to_dict") else None
-
         for field in update_data:
             setattr(db_obj, field, update_data[field])
 
-        await db.commit()
+        # Read the changed fields from the attribute history before the commit
+        # resets it, instead of diffing two full-row snapshots
+        previous_data, new_data = {}, {}
+        if user_uuid is not None:
+            state = inspect(db_obj)
+            for field in update_data:
+                if field not in state.attrs:
+                    continue
+                history = state.attrs[field].history
+                if history.has_changes():
+                    previous_data[field] = (
+                        history.deleted[0] if history.deleted else None
+                    )
+                    new_data[field] = history.added[0] if history.added else None
+
+        try:
+            await db.commit()
+        except Exception:
+            # Leave the session usable when a unique constraint rejects the change
+            await db.rollback()
+            raise
         await db.refresh(db_obj)
 
         # Log the update activity
@@ -169,13 +195,11 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
                 user_uuid=user_uuid,
                 action="update",
                 previous_data=previous_data,
-                new_data=(
-                    db_obj.to_dict() if hasattr(db_obj, "to_dict") else update_data
-                ),
-                description=f"{self.model_name} with identifier {self._get_identifier(db_obj)} updated successfully",
+                new_data=new_data,
+                description=self._desc_updated.format(self._get_identifier(db_obj)),
             )
 
-        await self.invalidate_cache()
+        await self.invalidate_rows_cache(db_obj)
 
         return db_obj
 
@@ -187,8 +211,10 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
         user_uuid: Optional[str] = None,
     ) -> ModelType:
         """Override remove method to add activity logging."""
-        # Store data for logging
-        previous_data = db_obj.to_dict() if hasattr(db_obj, "to_dict") else None
+        # Snapshot the row only when the deletion is going to be logged
+        previous_data = (
+            db_obj.to_dict() if user_uuid is not None and self._has_to_dict else None
+        )
         identifier = self._get_identifier(db_obj)
 
         await db.delete(db_obj)
@@ -200,9 +226,9 @@ class ActivityCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
                 user_uuid=user_uuid,
                 action="delete",
                 previous_data=previous_data,
-                description=f"{self.model_name} with identifier {identifier} deleted successfully",
+                description=self._desc_deleted.format(identifier),
             )
 
-        await self.invalidate_cache()
+        await self.invalidate_rows_cache(db_obj)
 
         return db_obj
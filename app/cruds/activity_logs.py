@@ -1,16 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Any, Tuple, Dict
+from typing import List, Optional, Any, Tuple, Dict
 from .base import CRUDBase
 from ..models.activity_logs import ActivityLog
 from ..cruds.base import CRUDBase
 from ..schemas.activity_logs import ActivityLogCreateSchema
 from ..core.loggers import db_logger as logger
+from ..services.redis_push import redis_push_async
 
 
 class CRUDActivityLog(
     CRUDBase[ActivityLog, ActivityLogCreateSchema, ActivityLogCreateSchema]
 ):
-    async def _remove_sensitive_data(
+    def _remove_sensitive_data(
         self, data: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
@@ -30,7 +31,7 @@ class CRUDActivityLog(
 
         return data
 
-    async def changes_made(
+    def changes_made(
         self,
         previous_data: Optional[Dict[str, Any]],
         new_data: Optional[Dict[str, Any]],
@@ -50,8 +51,8 @@ class CRUDActivityLog(
         if previous_data is None and new_data is None:
             return None, None
 
-        previous_data = await self._remove_sensitive_data(previous_data)
-        new_data = await self._remove_sensitive_data(new_data)
+        previous_data = self._remove_sensitive_data(previous_data)
+        new_data = self._remove_sensitive_data(new_data)
 
         if previous_data is None:
             return None, new_data
@@ -63,11 +64,7 @@ class CRUDActivityLog(
         previous_changes = {}
         new_changes = {}
 
-        # Check all keys in both dictionaries
-        all_keys = set(previous_data.keys()) | set(new_data.keys())
-
-        for key in all_keys:
-            prev_value = previous_data.get(key)
+        for key, prev_value in previous_data.items():
             new_value = new_data.get(key)
 
             if prev_value != new_value:
@@ -76,6 +73,11 @@ class CRUDActivityLog(
                 if new_value is not None:
                     new_changes[key] = new_value
 
+        # Keys that only exist after the action
+        for key in new_data.keys() - previous_data.keys():
+            if new_data[key] is not None:
+                new_changes[key] = new_data[key]
+
         return previous_changes, new_changes
 
     async def create(
@@ -92,7 +94,7 @@ class CRUDActivityLog(
         The created record after committing to the database.
         """
         db_obj = self.model(**obj_in.model_dump())
-        previous_changes, new_changes = await self.changes_made(
+        previous_changes, new_changes = self.changes_made(
             previous_data=db_obj.previous_data, new_data=db_obj.new_data
         )
         db_obj.previous_data = previous_changes or {}
@@ -109,5 +111,60 @@ class CRUDActivityLog(
             logger.error(f"Error creating object: {e}")
             raise RuntimeError(f"Error creating object: {e}")
 
+    def _masked_rows(
+        self, objs_in: List[ActivityLogCreateSchema]
+    ) -> List[Dict[str, Any]]:
+        """Apply the change diff and sensitive-data masking of `create` to a batch."""
+        rows = []
+        for obj_in in objs_in:
+            data = obj_in.model_dump()
+            previous_changes, new_changes = self.changes_made(
+                previous_data=data["previous_data"], new_data=data["new_data"]
+            )
+            data["previous_data"] = previous_changes or {}
+            data["new_data"] = new_changes or {}
+            rows.append(data)
+        return rows
+
+    async def create_multi(
+        self, db: AsyncSession, *, objs_in: List[ActivityLogCreateSchema]
+    ) -> List[ActivityLog]:
+        """
+        Create several activity logs in one transaction, applying the same
+        change diff and sensitive-data masking as `create`.
+        """
+        rows = self._masked_rows(objs_in)
+        return await super().create_multi(db, objs_in=rows)
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: List[ActivityLogCreateSchema],
+        batch_size: int = 200,
+    ) -> bool:
+        """
+        Masked variant of `CRUDBase.bulk_create`: one executemany INSERT per
+        batch with no ORM objects or refreshes. Used by the queue worker.
+        """
+        rows = self._masked_rows(objs_in)
+        return await super().bulk_create(db, objs_in=rows, batch_size=batch_size)
+
+    async def enqueue(self, objs_in: List[ActivityLogCreateSchema]) -> None:
+        """
+        Hand activity logs to the `activity_logs` stream instead of inserting
+        them on the request path. The whole list travels as one message and the
+        worker writes it with a single `bulk_create`.
+        """
+        if not objs_in:
+            return
+        message = {
+            "queue_name": "activity_logs",
+            "operation": "create_multi",
+            "log": False,
+            "data": [obj_in.model_dump() for obj_in in objs_in],
+        }
+        await redis_push_async(message=message, log=False)
+
 
 activity_log_crud = CRUDActivityLog(ActivityLog)
@@ -1,4 +1,15 @@
-from typing import Dict, Generic, Tuple, Type, TypeVar, List, Optional, Any, Union
+from typing import (
+    Dict,
+    Generic,
+    Tuple,
+    Type,
+    TypeVar,
+    List,
+    Optional,
+    Any,
+    AsyncIterator,
+    Union,
+)
 from math import ceil
 from datetime import datetime, timezone
 from sqlalchemy import (
@@ -13,7 +24,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy.orm import contains_eager, joinedload, raiseload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm.attributes import InstrumentedAttribute
@@ -350,15 +361,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 return column
         return None
 
-    def _build_nested_joinedload(self, relationship_path: str) -> Optional[Any]:
+    def _build_nested_load(self, relationship_path: str) -> Optional[Any]:
         """
-        Build a chained joinedload option from a nested relationship path.
+        Build a chained loader option from a nested relationship path.
+        Collections use selectinload and many-to-one links use joinedload.
 
         **Parameters**
         - `relationship_path`: Dot-separated path (e.g., 'roles.role_permissions.permission')
 
         **Returns**
-        SQLAlchemy joinedload option with chained relationships, or None if path is invalid
+        SQLAlchemy loader option with chained relationships, or None if path is invalid
         """
         if not relationship_path or "." not in relationship_path:
             return None
@@ -384,8 +396,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             )
             return None
 
-        # Build chained joinedload
-        current_load = joinedload(first_rel)
+        # Build chained loader, one IN query per collection hop
+        current_load = (
+            selectinload(first_rel)
+            if first_rel.property.uselist
+            else joinedload(first_rel)
+        )
         current_model = first_rel.property.mapper.class_
 
         # Chain remaining relationships
@@ -406,7 +422,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 )
                 return None
 
-            current_load = current_load.joinedload(next_rel)
+            current_load = (
+                current_load.selectinload(next_rel)
+                if next_rel.property.uselist
+                else current_load.joinedload(next_rel)
+            )
             current_model = next_rel.property.mapper.class_
 
         return current_load
@@ -437,7 +457,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
         for relation_name in relation_names:
             # Check if it's a nested path (contains dots)
             if "." in relation_name:
-                nested_load = self._build_nested_joinedload(relation_name)
+                nested_load = self._build_nested_load(relation_name)
                 if nested_load:
                     eager_load.append(nested_load)
             else:
@@ -645,12 +665,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
         fields: Optional[Union[str, List[Any]]] = None,
         sort: Optional[str] = "",
         query_filters: Optional[List[Any]] = None,
+        seek_filters: Optional[List[Any]] = None,
         group_by: Optional[List[Any]] = None,
         unique_records: Optional[bool] = False,
         distinct_fields: Optional[List[Any]] = None,
         is_distinct: Optional[bool] = False,
         return_rows: Optional[bool] = False,
         include_relations: Optional[str] = None,
+        total_count: Optional[int] = None,
         **filters: Any,
     ) -> Dict[str, Any]:
         """
@@ -667,11 +689,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             - `fields`: List of specific fields to select (default is None).
             - `sort`: A comma-separated list of fields to sort by (default is None).
             - `query_filters`: List of SQLAlchemy-style filters to apply (default is None).
+            - `seek_filters`: Keyset conditions that only position the page, e.g. a cursor predicate; they narrow the records but not `total_count` (default is None).
             - `group_by`: List of fields to group the query by (default is None).
             - `unique_records`: Flag to return only unique records (default is False).
             - `is_distinct`: Flag to apply distinct on the query (default is False).
             - `distinct_fields`: List of fields to use for distinct records (default is None).
             - `include_relations`: Comma-separated string of relation names to eager load (e.g., 'permissions,users')
+            - `total_count`: A total already known for these filters; when given, the records are not counted again (default is None).
             - `**filters`: Keyword arguments for filtering.
 
             **Returns**
@@ -782,9 +806,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             if sort_params:
                 statement = statement.order_by(*sort_params)
 
-            count_query = select(func.count()).select_from(statement.subquery())
-            total_count_result = await db.execute(count_query)
-            total_count = total_count_result.scalar()
+            if total_count is None:
+                count_query = select(func.count()).select_from(statement.subquery())
+                total_count_result = await db.execute(count_query)
+                total_count = total_count_result.scalar()
 
             # Execute the query
             result = await db.execute(statement)
@@ -805,8 +830,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
         if query_filters:
             filter_conditions.extend(query_filters)
 
-        if filter_conditions:
-            query = query.where(and_(*filter_conditions))
+        # Built once and shared by the page query and the fallback count
+        where_clause = and_(*filter_conditions) if filter_conditions else None
+        if where_clause is not None:
+            query = query.where(where_clause)
+        if seek_filters:
+            query = query.where(*seek_filters)
 
         # Apply joins
         if joins:
@@ -822,7 +851,6 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                     f"Skipping eager loading for {len(eager_load)} relationships because specific fields are selected"
                 )
             else:
-                # When selecting full models, we can use joinedload
                 # Handle both flat relationships and nested joinedload options
                 load_options = []
                 for relationship in eager_load:
@@ -830,9 +858,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                     if hasattr(relationship, "path") or hasattr(relationship, "_path"):
                         # It's already a joinedload option (nested relationship)
                         load_options.append(relationship)
+                    elif relationship.property.uselist:
+                        # Collections are loaded with a separate IN query so the
+                        # parent rows aren't multiplied by the JOIN
+                        load_options.append(selectinload(relationship))
                     else:
-                        # It's a flat relationship attribute
+                        # It's a flat many-to-one relationship attribute
                         load_options.append(joinedload(relationship))
+                if settings.DB_RAISELOAD:
+                    # Fail loudly on anything the list did not load up front
+                    load_options.append(raiseload("*"))
 
                 # Apply all load options at once
                 if load_options:
@@ -854,10 +889,32 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
         if is_distinct and distinct_fields:
             query = query.distinct(*distinct_fields)
 
+        # For plain paginated model queries, read the total from a window
+        # function on the same SELECT instead of running a separate COUNT
+        use_window_count = (
+            total_count is None
+            and limit > 0
+            and not resolved_fields
+            and not group_by
+            and not is_distinct
+            and not unique_records
+            and not seek_filters
+        )
+        if use_window_count:
+            query = query.add_columns(func.count().over().label("total_count"))
+
         # Execute the query
         result = await db.execute(query)
 
-        if resolved_fields:
+        if use_window_count:
+            rows = result.all()
+            data = [row[0] for row in rows]
+            if rows:
+                return {"data": data, "total_count": rows[0].total_count}
+            if skip == 0:
+                return {"data": data, "total_count": 0}
+            # An empty page past the end still needs the real total below
+        elif resolved_fields:
             data = [
                 {field.name: value for field, value in zip(resolved_fields, row)}
                 for row in result.all()
@@ -869,15 +926,70 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 else result.scalars().all()
             )
 
+        if total_count is not None:
+            return {"data": data, "total_count": total_count}
+
         count_query = select(func.count()).select_from(self.model)
-        if filter_conditions:
-            count_query = count_query.where(and_(*filter_conditions))
+        if where_clause is not None:
+            count_query = count_query.where(where_clause)
 
         total_count_result = await db.execute(count_query)
         total_count = total_count_result.scalar()
 
         return {"data": data, "total_count": total_count}
 
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = -1,
+        eager_load: Optional[List[Any]] = None,
+        sort: Optional[str] = "",
+        query_filters: Optional[List[Any]] = None,
+        yield_per: int = 500,
+        **filters: Any,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream records matching the filters in batches instead of loading them all at once.
+
+        **Parameters**
+        - `db`: The database session; it must stay open until the iteration finishes.
+        - `skip`: The number of records to skip (default is 0).
+        - `limit`: The maximum number of records to return (default is -1, no limit).
+        - `eager_load`: Loader options to apply, e.g. `selectinload(Model.relation)` (default is None).
+        - `sort`: A comma-separated list of fields to sort by (default is None).
+        - `query_filters`: List of SQLAlchemy-style filters to apply (default is None).
+        - `yield_per`: The number of rows fetched from the database per batch (default is 500).
+        - `**filters`: Keyword arguments for filtering.
+
+        **Returns**
+        An async iterator over the matching records.
+
+        **Example**
+        ```python
+        async for log in activity_log_crud.stream_multi(db=session, entity="User"):
+            ...
+        ```
+        """
+        filter_conditions = self._build_filters(filters)
+        if query_filters:
+            filter_conditions.extend(query_filters)
+
+        query = select(self.model)
+        if filter_conditions:
+            query = query.where(and_(*filter_conditions))
+        if eager_load:
+            query = query.options(*eager_load)
+        query = query.order_by(*self._extract_sort_params(sort))
+        query = query.offset(max(skip, 0))
+        if limit > 0:
+            query = query.limit(limit)
+
+        result = await db.stream_scalars(query.execution_options(yield_per=yield_per))
+        async for obj in result:
+            yield obj
+
     async def create(
         self, db: AsyncSession, *, obj_in: Union[CreateSchemaType, Dict[str, Any]]
     ) -> ModelType:
@@ -912,13 +1024,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
-            # Invalidate cache after successful creation
-            await self.invalidate_cache()
+            # A new row only affects list and count entries
+            await self.invalidate_rows_cache()
             return db_obj
         except Exception as e:
             await db.rollback()  # Rollback on failure to avoid partial commits
             logger.error(f"Error creating object: {e}")
-            raise RuntimeError(f"Error creating object: {e}")
+            raise RuntimeError(f"Error creating object: {e}") from e
 
     async def create_multi(
         self,
@@ -963,17 +1075,31 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             db.add_all(db_objs)
             await db.commit()
 
-            # Refresh the objects to reflect any database-generated values
-            for db_obj in db_objs:
-                await db.refresh(db_obj)
+            # Reload database-generated values (server-side timestamps) for the
+            # whole batch in one SELECT instead of refreshing row by row
+            identifier_field = self._get_identifier_field()
+            if identifier_field is not None:
+                identifier_name = self._get_identifier_field_name()
+                await db.execute(
+                    select(self.model)
+                    .where(
+                        identifier_field.in_(
+                            [getattr(db_obj, identifier_name) for db_obj in db_objs]
+                        )
+                    )
+                    .execution_options(populate_existing=True)
+                )
+            else:
+                for db_obj in db_objs:
+                    await db.refresh(db_obj)
 
-            # Invalidate cache after successful creation
-            await self.invalidate_cache()
+            # New rows only affect list and count entries
+            await self.invalidate_rows_cache()
             return db_objs
         except Exception as e:
             await db.rollback()  # Rollback the transaction on failure
             logger.error(f"Error creating multiple objects: {e}")
-            raise RuntimeError(f"Error creating multiple objects: {e}")
+            raise RuntimeError(f"Error creating multiple objects: {e}") from e
 
     async def bulk_create(
         self,
@@ -1031,8 +1157,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             # Commit all inserts
             await db.commit()
 
-            # Invalidate cache after successful bulk creation
-            await self.invalidate_cache()
+            # New rows only affect list and count entries
+            await self.invalidate_rows_cache()
             return True
 
         except Exception as e:
@@ -1110,13 +1236,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 db.add(db_obj)
                 await db.commit()
                 await db.refresh(db_obj)
-                # Invalidate cache after successful update
-                await self.invalidate_cache()
+                # Invalidate cache entries affected by this record
+                await self.invalidate_rows_cache(db_obj)
                 return db_obj
             except Exception as e:
                 await db.rollback()  # Rollback on failure to avoid partial commits
                 logger.error(f"Error updating object: {e}")
-                raise RuntimeError(f"Error updating object: {e}")
+                raise RuntimeError(f"Error updating object: {e}") from e
 
         raise ValueError(
             "Either `db_obj` and `obj_in` or `statement` must be provided."
@@ -1281,8 +1407,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             # Delete the record
             await db.delete(obj)
             await db.commit()
-            # Invalidate cache after successful deletion
-            await self.invalidate_cache()
+            # Invalidate cache entries affected by this record
+            await self.invalidate_rows_cache(obj)
 
         except Exception as e:
             await db.rollback()  # Rollback on failure to avoid partial commits
@@ -1363,8 +1489,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 await db.delete(obj)
 
             await db.commit()
-            # Invalidate cache after successful bulk deletion
-            await self.invalidate_cache()
+            # Invalidate cache entries affected by these records
+            await self.invalidate_rows_cache(*objs)
         except Exception as e:
             await db.rollback()  # Rollback on failure to avoid partial commits
             logger.error(f"Error deleting: {e}")
@@ -1416,8 +1542,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
                 db.add(db_obj)
                 await db.commit()
                 await db.refresh(db_obj)
-                # Invalidate cache after successful soft delete
-                await self.invalidate_cache()
+                # Invalidate cache entries affected by this record
+                await self.invalidate_rows_cache(db_obj)
                 return db_obj
             except Exception as e:
                 await db.rollback()
@@ -1462,8 +1588,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], CacheMixi
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
-            # Invalidate cache after successful restoration
-            await self.invalidate_cache()
+            # Invalidate cache entries affected by this record
+            await self.invalidate_rows_cache(db_obj)
             return db_obj
         except Exception as e:
             await db.rollback()
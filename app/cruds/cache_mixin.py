@@ -5,6 +5,11 @@ from ..services.cache_service import async_cache_service
 from ..core.loggers import app_logger as logger
 from ..core.config import settings
 
+# Left out of the shared count key: a cursor and its seek predicate only
+# position a page, and query_filters are built from scalar filters that are
+# already part of the key
+_COUNT_KEY_EXCLUDED = frozenset({"cursor", "query_filters", "seek_filters"})
+
 
 class CacheMixin:
     """Simplified mixin to add caching functionality to CRUD classes"""
@@ -84,13 +89,34 @@ class CacheMixin:
             # logger.info(f"Using cached data for {self.model_name} list")
             return cached_result
 
+        # Every page of the same filter set shares one total, so reuse it
+        # instead of counting the matching rows again for each page
+        count_key = self.cache_service.get_count_cache_key(
+            self.model_name,
+            **{
+                key: value
+                for key, value in filters.items()
+                if value is not None and key not in _COUNT_KEY_EXCLUDED
+            },
+        )
+        total_count = await self.cache_service.get(count_key)
+
         # If not in cache, fetch from database
         result = await self.get_multi(
-            db=db, skip=skip, limit=limit, sort=sort, **filters
+            db=db,
+            skip=skip,
+            limit=limit,
+            sort=sort,
+            total_count=total_count,
+            **filters,
         )
 
         # Cache the result using the optimized set method
         await self.cache_service.set(cache_key, result, self.ttl)
+        if total_count is None:
+            await self.cache_service.set(
+                count_key, result["total_count"], settings.CACHE_TTL_SHORT
+            )
 
         return result
 
@@ -103,6 +129,28 @@ class CacheMixin:
         """
         return await self.cache_service.invalidate_model_cache(self.model_name)
 
+    async def invalidate_rows_cache(self, *db_objs: Any) -> bool:
+        """
+        Invalidate the cache entries affected by writing the given records
+
+        Drops every list and count entry of this model plus the item entries of
+        the given records; item entries of other records stay cached. Call it
+        without records after inserts, since new rows have no item entries yet.
+
+        Args:
+            *db_objs: The records that were updated or deleted
+
+        Returns:
+            True if successful, False otherwise
+        """
+        identifier_name = self._get_identifier_field_name()
+        if identifier_name is None:
+            return await self.invalidate_cache()
+        return await self.cache_service.invalidate_model_rows(
+            self.model_name,
+            [str(getattr(db_obj, identifier_name)) for db_obj in db_objs],
+        )
+
     async def invalidate_list_cache(self, **filters) -> bool:
         """
         Invalidate specific list cache entries using optimized cache key generation
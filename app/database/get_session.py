@@ -1,6 +1,9 @@
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from ..core.config import settings
 from ..core.loggers import db_logger as logger
 
@@ -8,23 +11,25 @@ from ..core.loggers import db_logger as logger
 DATABASE_URL = settings.DATABASE_URL
 
 # Adjust engine options for SQLite
-engine_options = {}
+engine_options = {"query_cache_size": settings.DB_QUERY_CACHE_SIZE}
 if "sqlite" not in DATABASE_URL:
-    engine_options = {
+    engine_options |= {
         "pool_size": settings.DB_POOL_SIZE,
         "max_overflow": settings.DB_MAX_OVERFLOW,
         "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Reuse the most recently returned connection so idle ones can age out
+        "pool_use_lifo": True,
     }
 
 # Create the engine with appropriate options
 engine = create_async_engine(DATABASE_URL, **engine_options)
 
 # Configure the sessionmaker
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine,
-    autocommit=False,
     autoflush=False,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Callable
 from datetime import datetime
 import redis
@@ -15,7 +16,6 @@ from ..schemas.user_deps import UserDepSchema, PermissionSchema
 from ..database.get_session import get_async_session
 from ..cruds.users import user_crud
 from ..models.users import User
-from ..models.roles import Role
 from ..models.permissions import Permission
 from ..models.role_permissions import RolePermission
 from ..models.user_roles import UserRole
@@ -26,7 +26,11 @@ from ..utils.responses import (
 )
 from ..services.redis_base import get_async_redis_client
 from ..core.loggers import app_logger as logger
-from ..utils.security_util import is_token_valid_async, decode_access_token
+from ..utils.security_util import (
+    decode_access_token,
+    is_issued_after_logout,
+    local_auth_cache,
+)
 from ..utils.encryption_util import hash_token, encrypt_data, decrypt_data
 
 reuseable_oauth = OAuth2PasswordBearer(
@@ -40,17 +44,25 @@ async def get_user_permissions(user: User, db: AsyncSession):
     stmt = (
         select(Permission)
         .join(RolePermission, RolePermission.permission_uuid == Permission.uuid)
-        .join(Role, Role.uuid == RolePermission.role_uuid)
-        .join(UserRole, UserRole.role_uuid == Role.uuid)
-        .join(User, User.uuid == UserRole.user_uuid)
-        .where(User.uuid == user.uuid)
-        .distinct(Permission.uuid)
+        .join(UserRole, UserRole.role_uuid == RolePermission.role_uuid)
+        .where(UserRole.user_uuid == user.uuid)
+        .distinct()
     )
     result = await db.execute(stmt)
     permissions = result.scalars().all()
     return permissions
 
 
+async def cache_user_locally(
+    token_hash: str, user_data: UserDepSchema, cached_at: float
+) -> None:
+    """Keep an authenticated user in this worker's short-lived cache."""
+    if settings.AUTH_LOCAL_CACHE_TTL > 0:
+        await local_auth_cache.set(
+            token_hash, (cached_at, user_data), ttl=settings.AUTH_LOCAL_CACHE_TTL
+        )
+
+
 async def get_current_user(
     token: str = Depends(reuseable_oauth),
     session: AsyncSession = Depends(get_async_session),
@@ -60,23 +72,48 @@ async def get_current_user(
         payload = decode_access_token(token)
         token_data = TokenPayloadSchema(**payload)
 
+        # Use hashed token as cache key to prevent token exposure
+        token_hash = hash_token(token)
+
+        async_redis = await get_async_redis_client()
+        # Fetch the cached user, the logout timestamp and the permission-change
+        # markers in one round trip; every worker checks them on each request
+        cached_user, logout_at, *permissions_changed_at = await async_redis.mget(
+            f"token:{token_hash}",
+            f"user:logout:{token_data.sub}",
+            f"user:permissions:{token_data.sub}",
+            "permissions:changed_at",
+        )
+
         # Check if token was revoked (pass payload to avoid double decode)
-        if not await is_token_valid_async(
-            token, token_data.sub, token_type="access", payload=payload
-        ):
+        if not is_issued_after_logout(payload, logout_at):
             logger.warning(f"Attempted to use revoked token for user {token_data.sub}")
             return not_authorized_response("Token has been revoked")
 
-        # Use hashed token as Redis key to prevent token exposure
-        token_hash = hash_token(token)
-        async_redis = await get_async_redis_client()
-        cached_user = await async_redis.get(f"token:{token_hash}")
+        def is_fresh(cached_at: float) -> bool:
+            return all(
+                changed_at is None or cached_at > float(changed_at)
+                for changed_at in permissions_changed_at
+            )
+
+        if settings.AUTH_LOCAL_CACHE_TTL > 0:
+            local_entry = await local_auth_cache.get(token_hash)
+            if local_entry is not None and is_fresh(local_entry[0]):
+                return local_entry[1]
+
         if cached_user:
             # Decrypt cached user data
             try:
                 decrypted_data = decrypt_data(cached_user)
                 user_info = json.loads(decrypted_data)
-                return UserDepSchema(**user_info)
+                cached_at = user_info.pop("cached_at", 0)
+                if is_fresh(cached_at):
+                    user_data = UserDepSchema(**user_info)
+                    await cache_user_locally(token_hash, user_data, cached_at)
+                    return user_data
+                logger.info(
+                    f"Roles changed for user {token_data.sub}, refreshing cached user"
+                )
             except Exception as e:
                 logger.warning(
                     f"Failed to decrypt cached user data: {e}, fetching from DB"
@@ -100,8 +137,14 @@ async def get_current_user(
         # Use 60 minutes (60*60 seconds) as default expiry, unless expires_in is less
         expiry_time = min(3600, expires_in) if expires_in > 0 else 3600
         # Encrypt user data and use hashed token as key to prevent token exposure
-        encrypted_data = encrypt_data(user_data.model_dump_json())
+        cached_at = datetime.now().timestamp()
+        cache_payload = {
+            **user_data.model_dump(mode="json"),
+            "cached_at": cached_at,
+        }
+        encrypted_data = encrypt_data(json.dumps(cache_payload))
         await async_redis.setex(f"token:{token_hash}", expiry_time, encrypted_data)
+        await cache_user_locally(token_hash, user_data, cached_at)
         return user_data
     except HTTPException:
         # Re-raise HTTPException (from not_authorized_response, etc.) to preserve status code
@@ -122,10 +165,13 @@ async def get_current_user(
         return internal_server_error_response("Internal server error")
 
 
+@lru_cache(maxsize=None)
 def get_user_with_role(required_role: str) -> Callable:
     """
     Dependency to check if a user has at least one of the required roles.
 
+    Memoized like get_user_with_permission so routes share one dependency.
+
     :param required_role: Comma-separated list of required roles.
     :return: FastAPI dependency function.
     """
@@ -140,10 +186,15 @@ def get_user_with_role(required_role: str) -> Callable:
     return role_dependency
 
 
+@lru_cache(maxsize=None)
 def get_user_with_permission(required_permission: str) -> Callable:
     """
     Dependency to check if a user has at least one of the required permissions.
 
+    The factory is memoized so every route requiring the same permission shares
+    one dependency callable, which lets FastAPI's per-request dependency cache
+    resolve it only once.
+
     :param required_permission: Comma-separated list of required permissions.
     :return: FastAPI dependency function.
     """
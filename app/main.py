@@ -1,7 +1,7 @@
 # app/main.py
 import time
 from fastapi import FastAPI, status, Depends, Request
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, ORJSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,6 +18,7 @@ from pywebguard import FastAPIGuard
 from app.middlewares.webguard import (
     pyguard_config,
     async_redis_storage,
+    allowed_origins,
     route_rate_limits,
 )
 from app.core.config import settings
@@ -107,6 +108,8 @@ app = FastAPI(
     openapi_tags=settings.OPENAPI_TAGS,
     servers=settings.OPENAPI_SERVERS,
     lifespan=lifespan,
+    # Serialize API responses (notably large list payloads) with orjson
+    default_response_class=ORJSONResponse,
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
@@ -114,7 +117,7 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_HOSTS.split(","),
+    allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -205,7 +208,9 @@ async def ready():
             content={"detail": "Service unavailable", "checks": checks},
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         )
-    return JSONResponse(content={"status": "ready", "checks": checks})
+    return JSONResponse(
+        content={"status": "ready", "checks": checks, "pool": engine.pool.status()}
+    )
 
 
 app.include_router(docs_router, prefix="")
@@ -15,6 +15,11 @@ async_redis_storage = AsyncRedisStorage(
     prefix="pywebguard:",
 )
 
+# Parsed once at import and shared with the Starlette CORSMiddleware in main.
+allowed_origins = [
+    origin.strip() for origin in settings.ALLOWED_HOSTS.split(",") if origin.strip()
+]
+
 excluded_paths = [
     "/",
     "/ready",
@@ -45,7 +50,7 @@ pyguard_config = GuardConfig(
     ),
     cors=CORSConfig(
         enabled=True,
-        allow_origins=settings.ALLOWED_HOSTS.split(","),
+        allow_origins=allowed_origins,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         allow_headers=["*"],
         allow_credentials=True,
@@ -1,7 +1,7 @@
 from typing import Any, Dict, Optional
 from datetime import datetime
 import uuid as py_uuid
-from sqlalchemy import DateTime, String, BigInteger, text
+from sqlalchemy import DateTime, String, BigInteger, inspect, text
 from sqlalchemy.sql.sqltypes import Boolean
 from sqlalchemy.orm import mapped_column, Mapped
 from app.core.config import settings
@@ -22,8 +22,13 @@ class BaseModelMixin:
     delete_protection: Mapped[bool] = mapped_column(Boolean, default=False)
 
     def to_dict(self) -> Dict[str, Any]:
+        # Columns the query deferred are left out instead of lazy-loaded
+        state = inspect(self)
+        unloaded = state.unloaded if state.has_identity else ()
         return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
+            column.name: getattr(self, column.name)
+            for column in self.__table__.columns
+            if column.name not in unloaded
         }
 
     def to_raw_dict(self) -> Dict[str, Any]:
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.base_class import Base
 from .base_mixins import BaseIDSlugModelMixin
@@ -20,3 +20,7 @@ class Country(Base, BaseIDSlugModelMixin):
 
     def __str__(self) -> str:
         return f"Country(uuid={self.uuid}, name={self.name}, slug={self.slug})"
+
+
+# Names are unique regardless of case, so "ghana" and "Ghana" cannot coexist
+Index("ix_countries_name_lower", func.lower(Country.name), unique=True)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import String
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from ..database.base_class import Base
 from .base_mixins import BaseUUIDModelMixin
@@ -33,3 +33,7 @@ class Permission(Base, BaseUUIDModelMixin):
 
     def __str__(self) -> str:
         return f"ID: {self.uuid}, Name: {self.name}"
+
+
+# Names are unique regardless of case, whatever path writes them
+Index("ix_permissions_name_lower", func.lower(Permission.name), unique=True)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from ..database.base_class import Base
 from .base_mixins import BaseUUIDModelMixin
@@ -15,6 +15,14 @@ else:
 
 class RolePermission(Base, BaseUUIDModelMixin):
     __tablename__ = "role_permissions"
+    __table_args__ = (
+        Index(
+            "ix_role_permissions_role_uuid_permission_uuid",
+            "role_uuid",
+            "permission_uuid",
+            unique=True,
+        ),
+    )
 
     role_uuid: Mapped[str] = mapped_column(String(36), ForeignKey("roles.uuid"))
     permission_uuid: Mapped[str] = mapped_column(
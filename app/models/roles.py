@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from ..database.base_class import Base
 from .base_mixins import BaseUUIDModelMixin
@@ -48,3 +48,7 @@ class Role(Base, BaseUUIDModelMixin):
 
     def __str__(self) -> str:
         return f"Role ID: {self.uuid}, Name: {self.name}"
+
+
+# Names are unique regardless of case, whatever path writes them
+Index("ix_roles_name_lower", func.lower(Role.name), unique=True)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from ..database.base_class import Base
 from .base_mixins import BaseUUIDModelMixin
@@ -15,6 +15,11 @@ else:
 
 class UserRole(Base, BaseUUIDModelMixin):
     __tablename__ = "user_roles"
+    __table_args__ = (
+        Index(
+            "ix_user_roles_user_uuid_role_uuid", "user_uuid", "role_uuid", unique=True
+        ),
+    )
 
     role_uuid: Mapped[str] = mapped_column(
         String(36), ForeignKey("roles.uuid"), index=True
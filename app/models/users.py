@@ -1,6 +1,15 @@
 from typing import TYPE_CHECKING, Optional
 from datetime import date
-from sqlalchemy import Boolean, DateTime, String, Date, Text, BigInteger, ForeignKey
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    String,
+    Date,
+    Text,
+    BigInteger,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database.base_class import Base
@@ -25,6 +34,9 @@ else:
 
 class User(Base, BaseUUIDModelMixin, SoftDeleteMixin, S3URLMixin):
     __tablename__ = "users"
+    # Backs keyset pagination of the newest-first user list. On PostgreSQL the
+    # search columns also carry pg_trgm GIN indexes (migration b7d3f5a2e8c4)
+    __table_args__ = (Index("ix_users_created_at_uuid", "created_at", "uuid"),)
 
     # Specify which fields contain S3 URLs that need presigned URLs
     _s3_url_fields = ["avatar"]
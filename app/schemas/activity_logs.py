@@ -160,6 +160,10 @@ class ActivityLogFilters(BaseFilters):
     search: Optional[str] = Field(
         None, description="Search by entity, action, or user details"
     )
+    format: Optional[Literal["json", "ndjson"]] = Field(
+        "json",
+        description="Response format; 'ndjson' streams one activity log per line for exports",
+    )
 
     @model_validator(mode="after")
     def validate_action_filters(cls, values):
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field
 
 """BaseFilters Schema"""
@@ -41,3 +41,11 @@ class BaseFilters(BaseModel):
         description="A comma-separated list of fields to search in. Supports direct fields (e.g., 'name,email') and related fields (e.g., 'user.email,user.name,profile.bio'). If not provided, all string fields from the current model will be automatically detected and used for search.",
         example="name,label,description,user.email,user.first_name",
     )
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """Return the set filter values as CRUD keyword arguments.
+
+        Filters are flat scalars, so reading ``__dict__`` directly avoids the
+        per-request cost of a full ``model_dump()``.
+        """
+        return {key: value for key, value in self.__dict__.items() if value is not None}
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 from .base_schema import (
     BaseUUIDSchema,
@@ -7,6 +7,7 @@ from .base_schema import (
     BaseTotalCountResponseSchema,
 )
 from .base_filters import BaseFilters
+from .validate_uuid import UUIDStr
 
 """Permission Schema"""
 
@@ -54,6 +55,19 @@ class PermissionTotalCountListResponseSchema(BaseTotalCountResponseSchema):
     data: Optional[List[PermissionSchema]] = None
 
 
+class PermissionCheckSchema(BaseModel):
+    user_uuid: UUIDStr = Field(..., description="The user whose permissions to check")
+    permission_names: List[str] = Field(
+        ...,
+        min_length=1,
+        description="The permission names to check (e.g., ['can_read_users'])",
+    )
+
+
+class PermissionCheckResponseSchema(BaseResponseSchema):
+    data: Optional[Dict[str, bool]] = None
+
+
 class PermissionFiltersSchema(BaseFilters, PermissionSchema):
     name: Optional[str] = Field(
         None, description="Filter by the name of the permission"
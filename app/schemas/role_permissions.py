@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 from pydantic import UUID4, BaseModel, Field
 from .base_schema import (
     BaseUUIDSchema,
@@ -56,6 +56,10 @@ class RolePermissionFilters(BaseFilters):
         description="A comma-separated list of related models to include in the result set (e.g., 'role,permission')",
         example="role,permission",
     )
+    format: Optional[Literal["json", "ndjson"]] = Field(
+        "json",
+        description="Response format; 'ndjson' streams one role permission per line for exports",
+    )
 
 
 class RolePermissionCreateMultiSchema(BaseModel):
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import List, Literal, Optional, Annotated
 import dns.resolver
-from pydantic import BaseModel, EmailStr, Field, field_validator, constr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, constr
 from .base_schema import (
     BaseResponseSchema,
     BaseUUIDSchema,
@@ -288,6 +288,34 @@ class UserWithoutRoutesSchema(UserUpdateSchema, BaseUUIDSchema):
     country: Optional[CountrySchema] = None
 
 
+class UserSnapshotSchema(BaseModel):
+    """Flat user columns recorded in activity logs; the password is never included."""
+
+    uuid: str
+    email: str
+    first_name: str
+    last_name: str
+    phone_number: Optional[str] = None
+    gender: Optional[str] = None
+    address: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    avatar: Optional[str] = None
+    status: Optional[str] = None
+    is_verified: Optional[bool] = False
+    verified_at: Optional[datetime] = None
+    is_active: bool = False
+    last_login: Optional[datetime] = None
+    country_id: Optional[int] = None
+    views: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    delete_protection: bool = False
+    soft_deleted: bool = False
+    soft_deleted_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserSchema(UserUpdateSchema, BaseUUIDSchema):
     is_active: bool = False
     is_verified: bool = False
@@ -317,6 +345,7 @@ class UserListResponseSchema(BaseResponseSchema):
 
 class UserTotalCountListResponseSchema(BaseTotalCountResponseSchema):
     data: Optional[List[UserWithoutRoutesSchema]] = None
+    next_cursor: Optional[str] = None
 
 
 class UserLoginResponseSchema(BaseResponseSchema):
@@ -346,8 +375,12 @@ class UserFilters(BaseFilters):
     )
     has_dashboard_access: Optional[bool] = None
     include_relations: Optional[str] = Field(
-        "roles",
+        "roles,country",
         description="A comma-separated list of related models to include in the result set (e.g., 'permissions,users')",
-        example="roles",
+        example="roles,country",
     )
     country_id: Optional[int] = None
+    cursor: Optional[str] = Field(
+        None,
+        description="The next_cursor of the previous page; fetches the following page of newest-first results without an offset",
+    )
@@ -1,6 +1,6 @@
 import json
 import hashlib
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List
 from datetime import datetime
 from aiocache import caches, Cache
 from aiocache.serializers import JsonSerializer
@@ -225,12 +225,15 @@ class AsyncCacheService:
             logger.warning(f"Cache delete error for key {key}: {e}")
             return False
 
-    async def delete_pattern(self, pattern: str) -> bool:
+    async def delete_pattern(
+        self, pattern: str, key_filter: Optional[Callable[[str], bool]] = None
+    ) -> bool:
         """
         Delete all keys matching a pattern using SCAN for better performance
 
         Args:
             pattern: Redis pattern (e.g., 'roles:*')
+            key_filter: Optional predicate; only matching keys it accepts are deleted
 
         Returns:
             True if successful, False otherwise
@@ -266,6 +269,15 @@ class AsyncCacheService:
                         count=1000,  # Increased count for better coverage
                     )
 
+                    if keys and key_filter:
+                        keys = [
+                            key
+                            for key in keys
+                            if key_filter(
+                                key.decode() if isinstance(key, bytes) else key
+                            )
+                        ]
+
                     if keys:
                         # Delete keys in batch
                         deleted = await redis_client.delete(*keys)
@@ -304,6 +316,33 @@ class AsyncCacheService:
 
         return await self.delete_pattern(pattern)
 
+    async def invalidate_model_rows(
+        self, model_name: str, identifiers: List[str]
+    ) -> bool:
+        """
+        Invalidate only the cache entries a write to specific rows can affect
+
+        Every list and count entry of the model goes, together with the item
+        entries of the given rows and of lookups made without an identifier.
+        Item entries of other rows stay cached. One SCAN covers all of it.
+
+        Args:
+            model_name: Name of the model (e.g., 'roles', 'users')
+            identifiers: Identifiers of the written rows (empty for inserts)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        namespace = settings.APP_NAME.lower()
+        prefix = f"{namespace}:{model_name}:"
+        stale = ("list:", "count:", "item:None:") + tuple(
+            f"item:{identifier}:" for identifier in identifiers
+        )
+
+        return await self.delete_pattern(
+            f"{prefix}*", key_filter=lambda key: key[len(prefix) :].startswith(stale)
+        )
+
     def get_item_cache_key(self, model_name: str, identifier: str, **filters) -> str:
         """
         Generate cache key for individual item operations
@@ -366,6 +405,19 @@ class AsyncCacheService:
         """
         return self._generate_cache_key(f"{model_name}:list", **filters)
 
+    def get_count_cache_key(self, model_name: str, **filters) -> str:
+        """
+        Generate cache key for the total count of a filtered list
+
+        Args:
+            model_name: Name of the model
+            **filters: Filter parameters, without pagination (skip, limit, sort)
+
+        Returns:
+            Cache key string
+        """
+        return self._generate_cache_key(f"{model_name}:count", **filters)
+
     async def get_multi(self, keys: List[str]) -> Dict[str, Any]:
         """
         Get multiple values from cache in a single operation
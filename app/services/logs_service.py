@@ -146,9 +146,10 @@ class LogService:
 
             # Handle exact matches
             if " = " in condition:
-                field_match = re.search(r"(\w+) = '([^']+)'", condition)
+                field_match = re.search(r"(\w+) = '((?:[^'\\]|\\.)+)'", condition)
                 if field_match:
                     field, value = field_match.groups()
+                    value = re.sub(r"\\(.)", r"\1", value)
                     filtered_logs = [
                         log
                         for log in filtered_logs
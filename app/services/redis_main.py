@@ -128,6 +128,15 @@ class RedisMessageProcessor:
                                 db=db, obj_in=ActivityLogCreateSchema(**data)
                             )
                             logger.info(f"Activity log created successfully.")
+                    elif operation == "create_multi":
+                        async with AsyncSessionLocal() as db:
+                            await activity_log_crud.bulk_create(
+                                db=db,
+                                objs_in=[
+                                    ActivityLogCreateSchema(**item) for item in data
+                                ],
+                            )
+                            logger.info(f"{len(data)} activity logs created.")
                 except Exception as e:
                     logger.error(f"Failed to create activity log: {e}")
                     await process_poison_queue(queue_name, message)
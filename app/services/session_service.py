@@ -151,23 +151,19 @@ async def update_session_activity(
 
 async def close_user_session(
     db: AsyncSession,
-    session_uuid: str,
+    session: UserSession,
 ) -> bool:
     """
     Close a user session.
 
     Args:
         db: Database session
-        session_uuid: Session UUID
+        session: Already loaded UserSession object
 
     Returns:
         True if closed successfully
     """
     try:
-        session = await user_session_crud.get(db=db, uuid=session_uuid)
-        if not session:
-            return False
-
         await user_session_crud.update(
             db=db,
             db_obj=session,
@@ -180,9 +176,9 @@ async def close_user_session(
         # Clean up Redis mappings
         if session.token_jti:
             redis_client.delete(f"jti:{session.token_jti}")
-        redis_client.delete(f"session:last_update:{session_uuid}")
+        redis_client.delete(f"session:last_update:{session.uuid}")
 
-        logger.info(f"Closed session {session_uuid}")
+        logger.info(f"Closed session {session.uuid}")
         return True
     except Exception as e:
         logger.error(f"Error closing session: {e}")
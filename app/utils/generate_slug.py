@@ -1,13 +1,22 @@
 from slugify import slugify
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.cruds.base import CRUDBase
 
 
 async def generate_unique_slug(db: AsyncSession, crud: CRUDBase, value: str) -> str:
     base_slug = slugify(value, max_length=255)
+    # Fetch every taken variant of the slug in one query instead of probing each suffix
+    slug_column = crud.model.slug
+    result = await db.execute(
+        select(slug_column).where(
+            or_(slug_column == base_slug, slug_column.like(f"{base_slug}-%"))
+        )
+    )
+    taken = set(result.scalars().all())
     slug = base_slug
     counter = 1
-    while await crud.get(db=db, slug=slug) is not None:
+    while slug in taken:
         slug = f"{base_slug}-{counter}"
         counter += 1
     return slug
@@ -5,6 +5,7 @@ import hashlib
 import boto3
 import time
 from botocore.client import Config
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
 from app.core.loggers import app_logger as logger
 
@@ -82,8 +83,10 @@ async def save_file_to_s3(
             ),
         }
 
-        # Upload directly using put_object
-        response = s3.put_object(
+        # Upload directly using put_object; boto3 is blocking, so keep it
+        # off the event loop
+        response = await run_in_threadpool(
+            s3.put_object,
             Bucket=settings.S3_STORAGE_BUCKET,
             Key=filename,
             Body=content,
@@ -187,8 +190,9 @@ async def save_bytesio_to_s3(
             ),
         }
 
-        # Upload file to S3
-        s3.put_object(
+        # Upload file to S3 without blocking the event loop
+        await run_in_threadpool(
+            s3.put_object,
             Bucket=settings.S3_STORAGE_BUCKET,
             Key=filename,
             Body=content,
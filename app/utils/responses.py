@@ -1,6 +1,7 @@
 from typing import Any, Dict, Optional, Union
 from fastapi import HTTPException, status, Response
 from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 
 
 def created_response(
@@ -385,3 +386,34 @@ def custom_exception(
     if headers:
         exception.headers = headers
     raise exception
+
+
+def json_response(
+    adapter: TypeAdapter,
+    payload: Any,
+    *,
+    from_attributes: bool = True,
+    exclude_unset: bool = False,
+) -> Response:
+    """
+    Validate a payload and serialize it straight to JSON bytes.
+
+    Skips FastAPI's response_model pass, which would validate the payload
+    again and encode it through an intermediate dict. Routes returning it
+    register their schema with ``response_model=None`` and
+    ``responses={200: {"model": ...}}`` so the docs still show it.
+
+    Args:
+        adapter (TypeAdapter): Adapter for the response schema.
+        payload (Any): Response data; ORM objects are read by attribute.
+        from_attributes (bool): Read nested objects by attribute (default: True).
+        exclude_unset (bool): Leave out fields that were never set (default: False).
+
+    Returns:
+        Response: application/json response with the serialized payload.
+    """
+    response = adapter.validate_python(payload, from_attributes=from_attributes)
+    return Response(
+        content=adapter.dump_json(response, exclude_unset=exclude_unset),
+        media_type="application/json",
+    )
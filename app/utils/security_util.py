@@ -2,10 +2,17 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Union, Any, Tuple
 import jwt
+from aiocache import SimpleMemoryCache
 from ..core.config import settings
 from ..services.redis_base import client as redis_client, get_async_redis_client
 from ..core.loggers import app_logger as logger
 
+# Per-worker cache of authenticated users keyed by token hash. Entries expire
+# after AUTH_LOCAL_CACHE_TTL; get_current_user still checks the logout and
+# permission-change markers in Redis before trusting one, so logouts and role
+# changes apply on every worker at once.
+local_auth_cache = SimpleMemoryCache()
+
 
 def _create_token(
     subject: Union[str, Any],
@@ -140,6 +147,17 @@ def invalidate_user_tokens(user_uuid: str) -> bool:
         return False
 
 
+def is_issued_after_logout(payload: dict, logout_timestamp_str: Any) -> bool:
+    """
+    Check a decoded token against the user's logout timestamp.
+    Tokens issued before the last logout are revoked; no timestamp means none are.
+    """
+    if not logout_timestamp_str:
+        return True
+    iat = payload.get("iat")
+    return int(iat) >= int(logout_timestamp_str) if iat is not None else False
+
+
 def is_token_valid(
     token: str, user_uuid: str, token_type: str = "access", payload: dict = None
 ) -> bool:
@@ -153,8 +171,6 @@ def is_token_valid(
         if not logout_timestamp_str:
             return True
 
-        logout_timestamp = int(logout_timestamp_str)
-
         # Use provided payload or decode token
         if payload is None:
             if token_type == "access":
@@ -162,8 +178,7 @@ def is_token_valid(
             else:
                 payload = decode_refresh_token(token)
 
-        iat = payload.get("iat")
-        return int(iat) >= logout_timestamp if iat is not None else False
+        return is_issued_after_logout(payload, logout_timestamp_str)
     except (jwt.ExpiredSignatureError, jwt.PyJWTError):
         return False
     except Exception as e:
@@ -183,16 +198,13 @@ async def is_token_valid_async(
         if not logout_timestamp_str:
             return True
 
-        logout_timestamp = int(logout_timestamp_str)
-
         if payload is None:
             if token_type == "access":
                 payload = decode_access_token(token)
             else:
                 payload = decode_refresh_token(token)
 
-        iat = payload.get("iat")
-        return int(iat) >= logout_timestamp if iat is not None else False
+        return is_issued_after_logout(payload, logout_timestamp_str)
     except (jwt.ExpiredSignatureError, jwt.PyJWTError):
         return False
     except Exception as e:
@@ -216,3 +228,40 @@ async def invalidate_user_tokens_async(user_uuid: str) -> bool:
     except Exception as e:
         logger.error(f"Error invalidating user tokens: {e}")
         return False
+
+
+async def invalidate_user_permissions_async(user_uuid: str) -> bool:
+    """
+    Mark a user's cached auth data as stale after their roles change.
+    Stores one timestamp per user; cached entries older than it are re-fetched.
+    """
+    try:
+        redis = await get_async_redis_client()
+        # Cached user entries live at most an hour, so the marker can too
+        await redis.setex(
+            f"user:permissions:{user_uuid}",
+            3600,
+            str(datetime.now(tz=timezone.utc).timestamp()),
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error invalidating user permissions: {e}")
+        return False
+
+
+async def invalidate_all_permissions_async() -> bool:
+    """
+    Mark every cached user's auth data as stale after a role's permissions change.
+    One shared timestamp replaces finding and clearing each affected user's entry.
+    """
+    try:
+        redis = await get_async_redis_client()
+        await redis.setex(
+            "permissions:changed_at",
+            3600,
+            str(datetime.now(tz=timezone.utc).timestamp()),
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error invalidating permissions: {e}")
+        return False
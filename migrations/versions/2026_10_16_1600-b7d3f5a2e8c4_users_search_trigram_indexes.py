@@ -0,0 +1,46 @@
+"""users search trigram indexes
+
+Revision ID: b7d3f5a2e8c4
+Revises: a4c9e1f7d2b3
+Create Date: 2026-10-16 16:00:00.000000
+
+PostgreSQL only: the user search matches ILIKE '%term%', which a btree
+index can't serve. GIN trigram indexes can; they need the pg_trgm
+extension, so the migration role must be allowed to create it.
+MySQL and SQLite are left unchanged.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3f5a2e8c4"
+down_revision: Union[str, None] = "a4c9e1f7d2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ("email", "first_name", "last_name", "phone_number")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_users_{column}_trgm",
+            "users",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f"ix_users_{column}_trgm", table_name="users")